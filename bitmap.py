@@ -3,6 +3,8 @@ from typing import Optional, Union
 
 class Bitmap:
 
+    __slots__ = ('_value', '_size')
+
     def __init__(self,
                  size: Optional[int] = None,
                  value: int = 0,
@@ -28,38 +30,38 @@ class Bitmap:
         return self._get_bit(i)
 
     def _get_bit(self, i: int) -> int:
-        return ((self.value >> i) & 1)
+        return ((self._value >> i) & 1)
 
     def set_bit(self, i: int) -> None:
         self._validate_i(i)
         self._set_bit(i)
 
     def _set_bit(self, i: int) -> None:
-        self.value |= (1 << i)
+        self._value |= (1 << i)
 
     def clear_bit(self, i: int) -> None:
         self._validate_i(i)
         self._clear_bit(i)
 
     def _clear_bit(self, i: int) -> None:
-        ones = (1 << self._size) - 1
-        self.value &= (ones ^ (1 << i))
+        self._value &= ~(1 << i)
 
     def flip_bit(self, i: int) -> None:
         self._validate_i(i)
         self._flip_bit(i)
 
     def _flip_bit(self, i: int) -> None:
-        self.value ^= (1 << i)
+        self._value ^= (1 << i)
 
     def update_bit(self, i: int, v: Union[bool, int]) -> None:
+        self._validate_i(i)
         self._update_bit(i, v)
 
     def _update_bit(self, i: int, v: Union[bool, int]) -> None:
         if v == 1:
-            self.set_bit(i)
+            self._set_bit(i)
         elif v == 0:
-            self.clear_bit(i)
+            self._clear_bit(i)
         else:
             raise ValueError
 
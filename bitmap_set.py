@@ -8,15 +8,24 @@ Bounds = TypeVar('Bounds', int, tuple[int])
 Elem = TypeVar('Elem', int, tuple[int])
 Elems = TypeVar('Elems', int, Iterable[int], Iterable[tuple[int]])
 
+_WORD_SIZE = 64
+_WORD_MASK = (1 << _WORD_SIZE) - 1
+
 
 class BitmapSet(abc.MutableSet):
 
+    __slots__ = ('_bounds', '_size', '_bitmap', '_validate')
+
     # ------- init methods -----------------------------------------------------
 
-    def __init__(self, bounds: Bounds, elems: Optional[Elems] = None) -> None:
+    def __init__(self,
+                 bounds: Bounds,
+                 elems: Optional[Elems] = None,
+                 validate: bool = True) -> None:
         self._validate_bounds(bounds)
         self._bounds = bounds
         self._size = self._get_size(bounds)
+        self._validate = validate
         self._init_bitmap(elems)
 
     @abstractclassmethod
@@ -42,7 +51,12 @@ class BitmapSet(abc.MutableSet):
             raise TypeError
 
     def copy(self):
-        return self.__class__(self._bounds, elems=self._bitmap.value)
+        return self._new(self._bitmap.value)
+
+    def _new(self, value: int):
+        return self.__class__(self._bounds,
+                              elems=value,
+                              validate=self._validate)
 
     # ------- container methods ------------------------------------------------
 
@@ -50,26 +64,42 @@ class BitmapSet(abc.MutableSet):
     def size(self) -> int:
         return self._size
 
+    @property
+    def validate(self) -> bool:
+        return self._validate
+
     def __len__(self) -> int:
-        # return self._elems.bit_count()  # new in version 3.10
-        return bin(self._bitmap.value).count('1')
+        return self._bitmap.value.bit_count()
 
     def __iter__(self) -> Iterator[Elem]:
-        for i, bit in enumerate(reversed(bin(self._bitmap.value)[2:])):
-            if bit == '1':
-                yield self._unhash(i)
+        value = self._bitmap.value
+        offset = 0
+        while value:
+            word = value & _WORD_MASK
+            while word:
+                lowest_bit = word & -word
+                yield self._unhash(offset + lowest_bit.bit_length() - 1)
+                word ^= lowest_bit
+            value >>= _WORD_SIZE
+            offset += _WORD_SIZE
 
     def __reversed__(self) -> Iterator[Elem]:
-        bin_value = bin(self._bitmap.value)[2:]
-        for i, bit in zip(reversed(range(len(bin_value))), bin_value):
-            if bit == '1':
-                yield self._unhash(i)
+        value = self._bitmap.value
+        while value:
+            offset = (value.bit_length() - 1) // _WORD_SIZE * _WORD_SIZE
+            word = value >> offset
+            value ^= word << offset
+            while word:
+                i = word.bit_length() - 1
+                yield self._unhash(offset + i)
+                word ^= 1 << i
 
     def __repr__(self) -> str:
         return '{' + ', '.join([str(elem) for elem in iter(self)]) + '}'
 
-    def __reduce__(self) -> tuple[type, tuple[Bounds, int]]:
-        return (self.__class__, (self._bounds, self._bitmap.value))
+    def __reduce__(self) -> tuple[type, tuple[Bounds, int, bool]]:
+        return (self.__class__,
+                (self._bounds, self._bitmap.value, self._validate))
 
     # ------- single elem methods ----------------------------------------------
 
@@ -89,19 +119,19 @@ class BitmapSet(abc.MutableSet):
         return elem in self
 
     def __contains__(self, value: Elem) -> bool:
-        self._validate_elem(value)
-        i = self._hash(value)
-        return bool(self._bitmap.get_bit(i))
+        if self._validate:
+            self._validate_elem(value)
+        return bool(self._bitmap._get_bit(self._hash(value)))
 
     def __setitem__(self, elem: Elem, v: Union[bool, int]) -> None:
-        self._validate_elem(elem)
-        i = self._hash(elem)
-        self._bitmap.update_bit(i, v)
+        if self._validate:
+            self._validate_elem(elem)
+        self._bitmap._update_bit(self._hash(elem), v)
 
     def add(self, value: Elem) -> None:
-        self._validate_elem(value)
-        i = self._hash(value)
-        self._bitmap.set_bit(i)
+        if self._validate:
+            self._validate_elem(value)
+        self._bitmap._set_bit(self._hash(value))
 
     def __delitem__(self, elem: Elem) -> None:
         self.remove(elem)
@@ -113,15 +143,17 @@ class BitmapSet(abc.MutableSet):
             self.discard(value)
 
     def discard(self, value: Elem) -> None:
-        self._validate_elem(value)
-        i = self._hash(value)
-        self._bitmap.clear_bit(i)
+        if self._validate:
+            self._validate_elem(value)
+        self._bitmap._clear_bit(self._hash(value))
 
     def pop(self) -> Elem:
-        elem = next(iter(self))
-        i = self._hash(elem)
-        self._bitmap.clear_bit(i)
-        return elem
+        value = self._bitmap.value
+        if not value:
+            raise KeyError
+        i = (value & -value).bit_length() - 1
+        self._bitmap._clear_bit(i)
+        return self._unhash(i)
 
     def clear(self) -> None:
         self._bitmap.value = 0
@@ -192,7 +224,7 @@ class BitmapSet(abc.MutableSet):
         for other in others:
             self._validate_other(other)
             value |= other._bitmap.value
-        return self.__class__(self._bounds, elems=value)
+        return self._new(value)
 
     def update(self, *others):
         for other in others:
@@ -214,7 +246,7 @@ class BitmapSet(abc.MutableSet):
         for other in others:
             self._validate_other(other)
             value &= other._bitmap.value
-        return self.__class__(self._bounds, elems=value)
+        return self._new(value)
 
     def intersection_update(self, *others):
         for other in others:
@@ -233,12 +265,12 @@ class BitmapSet(abc.MutableSet):
         for other in others:
             self._validate_other(other)
             value -= (value & other._bitmap.value)
-        return self.__class__(self._bounds, elems=value)
+        return self._new(value)
 
     def __rsub__(self, other):
         self._validate_other(other)
         value = other._bitmap.value - (self._bitmap.value & other._bitmap.value)
-        return self.__class__(self._bounds, elems=value)
+        return self._new(value)
 
     def difference_update(self, *others):
         for other in others:
@@ -258,7 +290,7 @@ class BitmapSet(abc.MutableSet):
     def symmetric_difference(self, other):
         self._validate_other(other)
         value = self._bitmap.value ^ other._bitmap.value
-        return self.__class__(self._bounds, elems=value)
+        return self._new(value)
 
     def symmetric_difference_update(self, other):
         self._validate_other(other)
@@ -0,0 +1,82 @@
+import argparse
+import random
+import timeit
+
+from int_bitmap_set import IntBitmapSet
+from nd_bitmap_set import NdBitmapSet
+
+
+def get_bitmap_set(kind, size, elems, validate):
+    if kind == 'set':
+        return set(elems)
+    if kind == 'int':
+        return IntBitmapSet(size, elems=list(elems), validate=validate)
+    shape = (size // 16, 4, 4)
+    return NdBitmapSet(shape,
+                       elems=[(i // 16, i // 4 % 4, i % 4) for i in elems],
+                       validate=validate)
+
+
+def get_ops(bitmap_set, elems):
+    def discard_add():
+        for elem in elems:
+            bitmap_set.discard(elem)
+        for elem in elems:
+            bitmap_set.add(elem)
+
+    def contains():
+        for elem in elems:
+            _ = elem in bitmap_set
+
+    def iterate():
+        for _ in bitmap_set:
+            pass
+
+    def length():
+        for _ in elems:
+            len(bitmap_set)
+
+    return {
+        'discard/add': discard_add,
+        'contains': contains,
+        'iter': iterate,
+        'len': length,
+    }
+
+
+def time_ops(kind, size, validate, number, repeat, seed):
+    rng = random.Random(seed)
+    indices = rng.sample(range(size), size // 4)
+    bitmap_set = get_bitmap_set(kind, size, indices, validate)
+    if kind == 'nd':
+        elems = [(i // 16, i // 4 % 4, i % 4) for i in indices]
+    else:
+        elems = indices
+    return {
+        name: min(timeit.repeat(op, number=number, repeat=repeat)) / number
+        for name, op in get_ops(bitmap_set, elems).items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time BitmapSet operations with and without validation.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64, 1024])
+    parser.add_argument('--number', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'{"size":>5} {"kind":>4} {"validate":>8} {"op":>11} '
+          f'{"microseconds":>12}')
+    for size in args.sizes:
+        for kind, validate in (('int', True), ('int', False), ('nd', True),
+                               ('nd', False), ('set', None)):
+            times = time_ops(kind, size, validate, args.number, args.repeat,
+                             args.seed)
+            for name, seconds in times.items():
+                print(f'{size:>5} {kind:>4} {str(validate):>8} {name:>11} '
+                      f'{seconds * 1e6:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+from typing import Iterator, Optional, Union
+
+from latin_square_search_node import LatinSquareSearchNode, _get_hash_powers
+
+
+class BitmaskLatinSquareSearchNode(LatinSquareSearchNode):
+
+    def _init_symbols(self, cell_container: type) -> None:
+        super()._init_symbols(set)
+        self._domains: list[list[int]] = [[
+            sum(1 << s for s in cell) if isinstance(cell, set) else 0
+            for cell in row
+        ] for row in self._symbols]
+        self._symbols = [[  # type: ignore
+            None if isinstance(cell, set) else cell for cell in row
+        ] for row in self._symbols]
+
+    @property
+    def symbols(self) -> list[list[Union[int, set[int]]]]:
+        return [[
+            set(self._get_domain(r, c)) if cell is None else cell
+            for c, cell in enumerate(row)
+        ] for r, row in enumerate(self._symbols)]
+
+    def _copy_symbols(self, search_node: LatinSquareSearchNode) -> None:
+        search_node._symbols = [list(row) for row in self._symbols]
+        search_node._domains = [  # type: ignore
+            list(row) for row in self._domains
+        ]
+
+    def _set_symbol(self, r: int, c: int, s: int) -> None:
+        domain = self._domains[r][c]
+        self._liberties[domain.bit_count()].discard((r, c))
+        if self._row_counts is not None:
+            for t in self._get_domain(r, c):
+                if t != s:
+                    self._decrement_counts(r, c, t)
+        self._symbols[r][c] = s
+        self._hash_val += s * _get_hash_powers(self._n)[r][c]
+        if self._in_place:
+            self._trail.append((r, c, s, domain))
+        bit = 1 << s
+        domains = self._domains
+        symbols = self._symbols
+        for i in range(self._n):
+            if domains[r][i] & bit and symbols[r][i] is None:
+                self._remove_symbol(r, i, s)
+            if domains[i][c] & bit and symbols[i][c] is None:
+                self._remove_symbol(i, c, s)
+
+    def _undo(self, mark: int) -> None:
+        trail = self._trail
+        liberties = self._liberties
+        while len(trail) > mark:
+            r, c, s, domain = trail.pop()
+            if domain is None:
+                domain = self._domains[r][c]
+                size = domain.bit_count()
+                liberties[size].remove((r, c))
+                self._domains[r][c] = domain | (1 << s)
+                liberties[size + 1].add((r, c))
+                if self._row_counts is not None:
+                    self._increment_counts(r, c, s)
+            else:
+                self._symbols[r][c] = None  # type: ignore
+                self._hash_val -= s * _get_hash_powers(self._n)[r][c]
+                size = domain.bit_count()
+                liberties[size].add((r, c))
+                if size < self._min_size:
+                    self._min_size = size
+                if self._row_counts is not None:
+                    for t in self._get_domain(r, c):
+                        if t != s:
+                            self._increment_counts(r, c, t)
+
+    def _remove_symbol(self, r: int, c: int, s: int) -> None:
+        domain = self._domains[r][c]
+        size = domain.bit_count()
+        self._liberties[size].remove((r, c))
+        self._domains[r][c] = domain & ~(1 << s)
+        self._liberties[size - 1].add((r, c))
+        if size - 1 < self._min_size:
+            self._min_size = size - 1
+        if self._in_place:
+            self._trail.append((r, c, s, None))
+        if self._row_counts is not None:
+            self._decrement_counts(r, c, s)
+
+    # ------- cell domain methods ----------------------------------------------
+
+    def _is_open(self, r: int, c: int) -> bool:
+        return self._symbols[r][c] is None
+
+    def _get_domain(self, r: int, c: int) -> Iterator[int]:
+        domain = self._domains[r][c]
+        while domain:
+            bit = domain & -domain
+            yield bit.bit_length() - 1
+            domain ^= bit
+
+    def _get_domain_size(self, r: int, c: int) -> int:
+        return self._domains[r][c].bit_count()
+
+    def _has_symbol(self, r: int, c: int, s: int) -> bool:
+        return bool(self._domains[r][c] >> s & 1)
+
+    def _add_symbol(self, r: int, c: int, s: int) -> None:
+        self._domains[r][c] |= 1 << s
+
+    def _place_symbol(self, r: int, c: int, s: int) -> int:
+        self._symbols[r][c] = s
+        return self._domains[r][c]
+
+    def _unplace_symbol(self, r: int, c: int, cell: Optional[int]) -> None:
+        self._symbols[r][c] = None  # type: ignore
+        self._domains[r][c] = cell  # type: ignore
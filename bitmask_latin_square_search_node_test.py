@@ -0,0 +1,63 @@
+import unittest
+from copy import deepcopy
+
+from bitmask_latin_square_search_node import BitmaskLatinSquareSearchNode
+from latin_square_search_node import LatinSquareSearchNode
+
+
+class BitmaskLatinSquareSearchNodeTest(unittest.TestCase):
+
+    def test_symbols(self):
+        search_node = BitmaskLatinSquareSearchNode(4)
+        expected = LatinSquareSearchNode(4).symbols
+        self.assertEqual(search_node.symbols, expected)
+
+    def test_domains(self):
+        search_node = BitmaskLatinSquareSearchNode(4)
+        self.assertEqual(search_node._domains[1][2], 0b1001)
+        self.assertEqual(list(search_node._get_domain(1, 2)), [0, 3])
+        self.assertEqual(search_node._get_domain_size(1, 2), 2)
+
+    def test_get_children_in_place_restores_node(self):
+        search_node = BitmaskLatinSquareSearchNode(5, in_place=True)
+        symbols = search_node.symbols
+        domains = deepcopy(search_node._domains)
+        for child_node in search_node.get_children():
+            self.assertIs(child_node, search_node)
+            self.assertNotEqual(child_node.symbols, symbols)
+        self.assertEqual(search_node.symbols, symbols)
+        self.assertEqual(search_node._domains, domains)
+        self.assertEqual(search_node._trail, [])
+
+    def test_get_children_matches_set_node(self):
+        for in_place in (False, True):
+            search_node = LatinSquareSearchNode(5, in_place=in_place)
+            bitmask_search_node = BitmaskLatinSquareSearchNode(
+                5, in_place=in_place)
+            expected = [
+                deepcopy(child_node.symbols)
+                for child_node in search_node.get_children()
+            ]
+            actual = [
+                child_node.symbols
+                for child_node in bitmask_search_node.get_children()
+            ]
+            self.assertCountEqual(actual, expected)
+
+    def test_hash_val(self):
+        for in_place in (False, True):
+            search_node = BitmaskLatinSquareSearchNode(5, in_place=in_place)
+            expected = LatinSquareSearchNode(5).hash_val
+            self.assertEqual(search_node.hash_val, expected)
+            for child_node in search_node.get_children():
+                self.assertEqual(
+                    child_node.hash_val,
+                    sum(s * 5**(24 - (r * 5 + c))
+                        for r, row in enumerate(child_node.symbols)
+                        for c, s in enumerate(row) if isinstance(s, int)))
+            if in_place:
+                self.assertEqual(search_node.hash_val, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from operations import crs, csr, rsc, scr, src
+from utils import from_orthogonal_array, hash_latin_square, to_orthogonal_array
+
+Rows = Sequence[Sequence[int]]
+
+CONJUGATES = [rsc, crs, csr, src, scr]
+
+
+def canonicalize(latin_square: Rows,
+                 main_class: bool = True) -> tuple[list[list[int]], int]:
+    key = tuple(tuple(row) for row in latin_square)
+    canonical_form, hash_val = _canonicalize(key, main_class)
+    return [list(row) for row in canonical_form], hash_val
+
+
+@lru_cache(maxsize=65536)
+def _canonicalize(
+        latin_square: tuple[tuple[int, ...], ...],
+        main_class: bool) -> tuple[tuple[tuple[int, ...], ...], int]:
+    if main_class:
+        canonical_form = get_main_class_canonical_form(latin_square)
+    else:
+        canonical_form = get_isotopy_canonical_form(latin_square)
+    return (tuple(tuple(row) for row in canonical_form),
+            hash_latin_square(canonical_form))
+
+
+def get_isotopy_canonical_form(rows: Rows) -> list[list[int]]:
+    return _get_min_form([rows])
+
+
+def get_main_class_canonical_form(latin_square: Rows) -> list[list[int]]:
+    return _get_min_form(_get_conjugate_squares(latin_square))
+
+
+def _get_min_form(squares: Sequence[Rows]) -> list[list[int]]:
+    n = len(squares[0][0])
+    if len(squares[0]) < 2:
+        return [list(range(n))]
+    min_pairs = [_get_min_pairs(rows) for rows in squares]
+    min_second_row = min(second_row for second_row, _ in min_pairs)
+    canonical_form = None
+    for rows, (second_row, pairs) in zip(squares, min_pairs):
+        if second_row != min_second_row:
+            continue
+        candidate = _get_min_candidate(rows, second_row, pairs,
+                                       canonical_form)
+        if candidate is not None and (canonical_form is None
+                                      or candidate < canonical_form):
+            canonical_form = candidate
+    assert canonical_form is not None
+    return [list(row) for row in canonical_form]
+
+
+def is_isotopy_canonical(rows: Rows) -> bool:
+    n = len(rows[0])
+    if tuple(rows[0]) != tuple(range(n)):
+        return False
+    if len(rows) == 1:
+        return True
+    current_form = [tuple(row) for row in rows]
+    second_row, pairs = _get_min_pairs(rows)
+    if second_row < current_form[1]:
+        return False
+    candidate = _get_min_candidate(rows, second_row, pairs, current_form)
+    return candidate is None or not candidate < current_form
+
+
+def is_main_class_canonical(latin_square: Rows) -> bool:
+    if not is_isotopy_canonical(latin_square):
+        return False
+    return get_main_class_canonical_form(latin_square) == [
+        list(row) for row in latin_square
+    ]
+
+
+def _get_conjugate_squares(latin_square: Rows) -> list[Rows]:
+    orthogonal_array = to_orthogonal_array(latin_square)
+    return [latin_square] + [
+        from_orthogonal_array(
+            [conjugate(triple) for triple in orthogonal_array])
+        for conjugate in CONJUGATES
+    ]
+
+
+def get_canonical_second_row(cycle_lengths: Sequence[int]) -> tuple[int, ...]:
+    second_row = []
+    start = 0
+    for length in sorted(cycle_lengths):
+        second_row.extend(range(start + 1, start + length))
+        second_row.append(start)
+        start += length
+    return tuple(second_row)
+
+
+def _get_min_pairs(rows: Rows) -> tuple[tuple[int, ...], list[tuple]]:
+    pairs: list[tuple] = []
+    min_second_row = None
+    for i, top_row in enumerate(rows):
+        inverse = _invert(top_row)
+        for j, row in enumerate(rows):
+            if i == j:
+                continue
+            permutation = [inverse[s] for s in row]
+            cycles = _get_cycles(permutation)
+            second_row = get_canonical_second_row(
+                [len(cycle) for cycle in cycles])
+            if min_second_row is None or second_row < min_second_row:
+                min_second_row = second_row
+                pairs = []
+            if second_row == min_second_row:
+                pairs.append((i, j, inverse, cycles))
+    assert min_second_row is not None
+    return min_second_row, pairs
+
+
+def _get_min_candidate(
+        rows: Rows,
+        min_second_row: tuple[int, ...],
+        pairs: list[tuple],
+        bound: Optional[list[tuple[int, ...]]] = None
+) -> Optional[list[tuple[int, ...]]]:
+    # Returns the smallest form over all pairs, or None if every form is
+    # known to be greater than bound from its third row alone.
+    num_rows = len(rows)
+    first_row = tuple(range(len(min_second_row)))
+    if num_rows == 2:
+        return [first_row, min_second_row]
+    target_cycles = _get_cycles(list(min_second_row))
+    target_cycle_of = _get_cycle_of(target_cycles)
+    min_third_row = None if bound is None else bound[2]
+    canonical_form = None
+    canonical_row_map: list[int] = []
+    # Pairs related by an autotopism yield the same forms, so only one pair
+    # of each known orbit is expanded. Autotopisms are found whenever two
+    # candidates coincide.
+    orbits = list(range(num_rows * num_rows))
+    expanded: list[int] = []
+    for i, j, inverse, cycles in pairs:
+        orbit = _find(orbits, i * num_rows + j)
+        if any(_find(orbits, pair) == orbit for pair in expanded):
+            continue
+        expanded.append(orbit)
+        other_indices = [k for k in range(num_rows) if k != i and k != j]
+        other_rows = [[inverse[s] for s in rows[k]] for k in other_indices]
+        cycle_of = _get_cycle_of(cycles)
+        conjugators: list[list[int]] = []
+        for row in other_rows:
+            result = _get_min_conjugates(row, cycles, cycle_of, target_cycles,
+                                         target_cycle_of, min_third_row)
+            if result is None:
+                continue
+            third_row, row_conjugators = result
+            if min_third_row is None or third_row < min_third_row:
+                min_third_row = third_row
+                conjugators = []
+            conjugators.extend(row_conjugators)
+        for conjugator in conjugators:
+            inverse_conjugator = _invert(conjugator)
+            transformed_rows = sorted(
+                (tuple([conjugator[row[c]] for c in inverse_conjugator]), k)
+                for row, k in zip(other_rows, other_indices))
+            candidate = [first_row, min_second_row]
+            candidate.extend(row for row, _ in transformed_rows)
+            row_map = [0] * num_rows
+            row_map[j] = 1
+            for position, (_, k) in enumerate(transformed_rows, 2):
+                row_map[k] = position
+            if canonical_form is None or candidate < canonical_form:
+                canonical_form = candidate
+                canonical_row_map = _invert(row_map)
+            elif candidate == canonical_form:
+                autotopism = [canonical_row_map[x] for x in row_map]
+                for a in range(num_rows):
+                    for b in range(num_rows):
+                        if a != b:
+                            _union(orbits, a * num_rows + b,
+                                   autotopism[a] * num_rows + autotopism[b])
+    return canonical_form
+
+
+def _get_min_conjugates(
+    row: Sequence[int], cycles: list[list[int]],
+    cycle_of: list[tuple[list[int], int]], target_cycles: list[list[int]],
+    target_cycle_of: list[tuple[list[int], int]],
+    bound: Optional[tuple[int, ...]]
+) -> Optional[tuple[tuple[int, ...], list[list[int]]]]:
+    # Finds the conjugators mapping cycles onto target_cycles under which row
+    # becomes lexicographically smallest, building them one column at a time
+    # and keeping only the states that tie on the prefix so far. Returns None
+    # once the prefix exceeds bound.
+    n = len(row)
+    states = [([-1] * n, [-1] * n)]
+    transformed_row = []
+    tight = bound is not None
+    for c in range(n):
+        next_states = []
+        for conjugator, inverse_conjugator in states:
+            if inverse_conjugator[c] != -1:
+                next_states.append((conjugator, inverse_conjugator))
+                continue
+            # c starts a target cycle that no cycle has been mapped onto yet.
+            target_cycle = target_cycle_of[c][0]
+            length = len(target_cycle)
+            for cycle in cycles:
+                if len(cycle) != length or conjugator[cycle[0]] != -1:
+                    continue
+                for offset in range(length):
+                    state = (list(conjugator), list(inverse_conjugator))
+                    _map_cycle(state, cycle, offset, target_cycle)
+                    next_states.append(state)
+        min_value = n
+        states = []
+        for state in next_states:
+            conjugator, inverse_conjugator = state
+            y = row[inverse_conjugator[c]]
+            value = conjugator[y]
+            if value == -1:
+                # The smallest image of y is the start of the first free
+                # target cycle of its length, and choosing it is forced.
+                cycle, offset = cycle_of[y]
+                for target_cycle in target_cycles:
+                    if (len(target_cycle) == len(cycle)
+                            and inverse_conjugator[target_cycle[0]] == -1):
+                        break
+                _map_cycle(state, cycle, offset, target_cycle)
+                value = target_cycle[0]
+            if value < min_value:
+                min_value = value
+                states = []
+            if value == min_value:
+                states.append(state)
+        if tight:
+            assert bound is not None
+            if min_value > bound[c]:
+                return None
+            tight = min_value == bound[c]
+        transformed_row.append(min_value)
+    return tuple(transformed_row), [conjugator for conjugator, _ in states]
+
+
+def _map_cycle(state: tuple[list[int], list[int]], cycle: list[int],
+               offset: int, target_cycle: list[int]) -> None:
+    conjugator, inverse_conjugator = state
+    length = len(cycle)
+    for k, c in enumerate(target_cycle):
+        x = cycle[(k + offset) % length]
+        conjugator[x] = c
+        inverse_conjugator[c] = x
+
+
+def _get_cycle_of(
+        cycles: list[list[int]]) -> list[tuple[list[int], int]]:
+    cycle_of: list[tuple[list[int], int]] = [
+        ([], 0) for _ in range(sum(len(cycle) for cycle in cycles))
+    ]
+    for cycle in cycles:
+        for k, x in enumerate(cycle):
+            cycle_of[x] = (cycle, k)
+    return cycle_of
+
+
+def _find(parents: list[int], x: int) -> int:
+    while parents[x] != x:
+        parents[x] = parents[parents[x]]
+        x = parents[x]
+    return x
+
+
+def _union(parents: list[int], x: int, y: int) -> None:
+    x = _find(parents, x)
+    y = _find(parents, y)
+    if x != y:
+        parents[max(x, y)] = min(x, y)
+
+
+def _get_cycles(permutation: Sequence[int]) -> list[list[int]]:
+    seen = [False] * len(permutation)
+    cycles = []
+    for start in range(len(permutation)):
+        if seen[start]:
+            continue
+        cycle = []
+        x = start
+        while not seen[x]:
+            seen[x] = True
+            cycle.append(x)
+            x = permutation[x]
+        cycles.append(cycle)
+    return cycles
+
+
+def _invert(permutation: Sequence[int]) -> list[int]:
+    inverse = [0] * len(permutation)
+    for i, x in enumerate(permutation):
+        inverse[x] = i
+    return inverse
@@ -0,0 +1,141 @@
+import unittest
+
+from canonical_form import (canonicalize, get_canonical_second_row,
+                            get_isotopy_canonical_form,
+                            get_main_class_canonical_form,
+                            is_isotopy_canonical, is_main_class_canonical)
+from operations import csr
+from utils import (from_orthogonal_array, hash_latin_square,
+                   to_orthogonal_array)
+
+
+class CanonicalFormTest(unittest.TestCase):
+
+    def test_get_canonical_second_row(self):
+        self.assertTupleEqual(get_canonical_second_row([3, 2]),
+                              (1, 0, 3, 4, 2))
+        self.assertTupleEqual(get_canonical_second_row([4]), (1, 2, 3, 0))
+
+    def test_get_isotopy_canonical_form(self):
+        latin_square = [
+            [2, 0, 1, 3],
+            [3, 2, 0, 1],
+            [0, 1, 3, 2],
+            [1, 3, 2, 0],
+        ]
+        expected = [
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 1, 0],
+            [3, 2, 0, 1],
+        ]
+        self.assertListEqual(get_isotopy_canonical_form(latin_square),
+                             expected)
+        self.assertTrue(is_isotopy_canonical(expected))
+        self.assertFalse(is_isotopy_canonical(latin_square))
+
+    def test_get_isotopy_canonical_form_of_rectangle(self):
+        latin_rectangle = [
+            [0, 1, 2, 3, 4],
+            [1, 2, 3, 4, 0],
+        ]
+        expected = [
+            [0, 1, 2, 3, 4],
+            [1, 2, 3, 4, 0],
+        ]
+        self.assertListEqual(get_isotopy_canonical_form(latin_rectangle),
+                             expected)
+        self.assertTrue(is_isotopy_canonical(latin_rectangle))
+        self.assertTrue(is_isotopy_canonical([[0, 1, 2]]))
+        self.assertFalse(is_isotopy_canonical([[1, 0, 2]]))
+
+    def test_is_isotopy_canonical_rows_sorted(self):
+        latin_square = [
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [3, 2, 1, 0],
+            [2, 3, 0, 1],
+        ]
+        self.assertFalse(is_isotopy_canonical(latin_square))
+        self.assertTrue(is_isotopy_canonical(sorted(latin_square)))
+
+    def test_invariant_under_isotopy(self):
+        latin_square = [
+            [0, 1, 2, 3, 4],
+            [1, 0, 3, 4, 2],
+            [2, 3, 4, 0, 1],
+            [3, 4, 1, 2, 0],
+            [4, 2, 0, 1, 3],
+        ]
+        row_map = [3, 0, 4, 1, 2]
+        column_map = [1, 4, 0, 2, 3]
+        symbol_map = [2, 3, 1, 4, 0]
+        isotope = [[0] * 5 for _ in range(5)]
+        for r, row in enumerate(latin_square):
+            for c, s in enumerate(row):
+                isotope[row_map[r]][column_map[c]] = symbol_map[s]
+        self.assertListEqual(get_isotopy_canonical_form(isotope),
+                             get_isotopy_canonical_form(latin_square))
+
+    def test_group_table(self):
+        group_table = [[r ^ c for c in range(8)] for r in range(8)]
+        row_map = [5, 2, 7, 0, 3, 6, 1, 4]
+        column_map = [3, 7, 1, 4, 0, 6, 2, 5]
+        symbol_map = [6, 0, 4, 2, 7, 1, 5, 3]
+        isotope = [[0] * 8 for _ in range(8)]
+        for r, row in enumerate(group_table):
+            for c, s in enumerate(row):
+                isotope[row_map[r]][column_map[c]] = symbol_map[s]
+        self.assertListEqual(get_isotopy_canonical_form(isotope), group_table)
+        self.assertListEqual(get_main_class_canonical_form(isotope),
+                             group_table)
+        self.assertTrue(is_main_class_canonical(group_table))
+
+    def test_is_main_class_canonical(self):
+        latin_square = [
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 0, 1],
+            [3, 2, 1, 0],
+        ]
+        self.assertTrue(is_main_class_canonical(latin_square))
+        self.assertFalse(is_main_class_canonical(latin_square[::-1]))
+
+    def test_get_main_class_canonical_form(self):
+        latin_square = [
+            [0, 1, 2, 3, 4],
+            [1, 0, 3, 4, 2],
+            [2, 3, 4, 0, 1],
+            [3, 4, 1, 2, 0],
+            [4, 2, 0, 1, 3],
+        ]
+        conjugate = from_orthogonal_array(
+            [csr(triple) for triple in to_orthogonal_array(latin_square)])
+        canonical_form = get_main_class_canonical_form(latin_square)
+        self.assertListEqual(get_main_class_canonical_form(conjugate),
+                             canonical_form)
+        self.assertTrue(is_main_class_canonical(canonical_form))
+        self.assertLessEqual(canonical_form,
+                             get_isotopy_canonical_form(latin_square))
+
+    def test_canonicalize(self):
+        latin_square = [
+            [2, 0, 1, 3],
+            [3, 2, 0, 1],
+            [0, 1, 3, 2],
+            [1, 3, 2, 0],
+        ]
+        canonical_form, hash_val = canonicalize(latin_square)
+        self.assertListEqual(canonical_form,
+                             get_main_class_canonical_form(latin_square))
+        self.assertEqual(hash_val, hash_latin_square(canonical_form))
+        canonical_form[0][0] = 3
+        self.assertEqual(canonicalize(latin_square)[0][0][0], 0)
+        isotopy_canonical_form, _ = canonicalize(latin_square,
+                                                 main_class=False)
+        self.assertListEqual(isotopy_canonical_form,
+                             get_isotopy_canonical_form(latin_square))
+
+
+if __name__ == '__main__':
+    unittest.main()
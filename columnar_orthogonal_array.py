@@ -0,0 +1,102 @@
+from typing import Any, Sequence
+
+import numpy as np
+
+from operations import CONJUGATE_COLUMNS, CONJUGATE_NAMES, compose_conjugates
+from utils import Triple
+
+
+class ColumnarOrthogonalArray:
+
+    def __init__(self, n: int, r: np.ndarray, c: np.ndarray,
+                 s: np.ndarray) -> None:
+        if not r.shape == c.shape == s.shape or r.shape[-1:] != (n * n,):
+            raise ValueError
+        self._n = n
+        self._columns = (r, c, s)
+
+    @classmethod
+    def from_latin_squares(cls, latin_squares: Any) -> 'ColumnarOrthogonalArray':
+        latin_squares = np.asarray(latin_squares)
+        if latin_squares.ndim < 2:
+            raise ValueError
+        n = latin_squares.shape[-1]
+        if latin_squares.shape[-2] != n:
+            raise ValueError
+        shape = latin_squares.shape[:-2] + (n * n,)
+        indices = np.arange(n * n, dtype=np.intp)
+        r = np.broadcast_to((indices // n).astype(latin_squares.dtype), shape)
+        c = np.broadcast_to((indices % n).astype(latin_squares.dtype), shape)
+        s = latin_squares.reshape(shape)
+        return cls(n, r, c, s)
+
+    @classmethod
+    def from_orthogonal_array(
+            cls, orthogonal_array: Sequence[Triple]) -> 'ColumnarOrthogonalArray':
+        columns = np.array(orthogonal_array, dtype=np.intp).reshape(-1, 3)
+        n = int(round(len(columns)**0.5))
+        return cls(n, columns[:, 0], columns[:, 1], columns[:, 2])
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def r(self) -> np.ndarray:
+        return self._columns[0]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self._columns[1]
+
+    @property
+    def s(self) -> np.ndarray:
+        return self._columns[2]
+
+    @property
+    def batch_shape(self) -> tuple[int, ...]:
+        return self._columns[0].shape[:-1]
+
+    def conjugate(self, *names: str) -> 'ColumnarOrthogonalArray':
+        name = compose_conjugates(*names)
+        r, c, s = (self._columns[i] for i in CONJUGATE_COLUMNS[name])
+        return ColumnarOrthogonalArray(self._n, r, c, s)
+
+    def to_latin_squares(self) -> np.ndarray:
+        n = self._n
+        r, c, s = (column.reshape(-1, n * n) for column in self._columns)
+        latin_squares = np.empty((len(s), n, n), dtype=s.dtype)
+        latin_squares[np.arange(len(s))[:, np.newaxis], r, c] = s
+        return latin_squares.reshape(self.batch_shape + (n, n))
+
+    def to_orthogonal_array(self) -> list[Triple]:
+        if self.batch_shape:
+            raise ValueError
+        return [
+            Triple(r=r, c=c, s=s)
+            for r, c, s in zip(*(column.tolist() for column in self._columns))
+        ]
+
+
+def get_all_conjugates(latin_squares: Any) -> np.ndarray:
+    latin_squares = np.asarray(latin_squares)
+    if latin_squares.ndim != 3 or latin_squares.shape[1] != latin_squares.shape[2]:
+        raise ValueError
+    k, n, _ = latin_squares.shape
+    indices = np.broadcast_to(np.arange(n, dtype=latin_squares.dtype),
+                              latin_squares.shape)
+    row_inverses = np.empty_like(latin_squares)
+    np.put_along_axis(row_inverses, latin_squares.astype(np.intp), indices,
+                      axis=2)
+    column_inverses = np.empty_like(latin_squares)
+    np.put_along_axis(column_inverses, latin_squares.astype(np.intp),
+                      indices.transpose(0, 2, 1), axis=1)
+    conjugates = {
+        'rcs': latin_squares,
+        'crs': latin_squares.transpose(0, 2, 1),
+        'rsc': row_inverses,
+        'src': row_inverses.transpose(0, 2, 1),
+        'scr': column_inverses,
+        'csr': column_inverses.transpose(0, 2, 1),
+    }
+    return np.stack([conjugates[name] for name in CONJUGATE_NAMES], axis=1)
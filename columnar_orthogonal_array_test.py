@@ -0,0 +1,143 @@
+import unittest
+
+from operations import (CONJUGATE_NAMES, crs, csr,
+                        permute_orthogonal_array_triple, rcs, rsc, scr, src)
+from utils import Triple, from_orthogonal_array, to_orthogonal_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from columnar_orthogonal_array import (ColumnarOrthogonalArray,
+                                           get_all_conjugates)
+
+CONJUGATES = {
+    'rcs': rcs,
+    'rsc': rsc,
+    'crs': crs,
+    'csr': csr,
+    'src': src,
+    'scr': scr,
+}
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class ColumnarOrthogonalArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self._latin_square = [
+            [0, 2, 1, 3],
+            [1, 3, 0, 2],
+            [2, 0, 3, 1],
+            [3, 1, 2, 0],
+        ]
+
+    def test_from_latin_squares(self):
+        orthogonal_array = ColumnarOrthogonalArray.from_latin_squares(
+            [[0, 1, 2], [1, 2, 0], [2, 0, 1]])
+        self.assertEqual(orthogonal_array.n, 3)
+        self.assertEqual(orthogonal_array.batch_shape, ())
+        self.assertListEqual(orthogonal_array.r.tolist(),
+                             [0, 0, 0, 1, 1, 1, 2, 2, 2])
+        self.assertListEqual(orthogonal_array.c.tolist(),
+                             [0, 1, 2, 0, 1, 2, 0, 1, 2])
+        self.assertListEqual(orthogonal_array.s.tolist(),
+                             [0, 1, 2, 1, 2, 0, 2, 0, 1])
+
+    def test_from_uint8_latin_squares(self):
+        n = 17
+        latin_square = np.array([[(r + c) % n for c in range(n)]
+                                 for r in range(n)],
+                                dtype=np.uint8)
+        orthogonal_array = ColumnarOrthogonalArray.from_latin_squares(
+            latin_square)
+        self.assertEqual(orthogonal_array.r.max(), n - 1)
+        self.assertEqual(orthogonal_array.c.max(), n - 1)
+        self.assertTrue(
+            np.array_equal(orthogonal_array.to_latin_squares(), latin_square))
+        expected = from_orthogonal_array(
+            permute_orthogonal_array_triple(
+                to_orthogonal_array(latin_square.tolist()), csr))
+        self.assertListEqual(
+            orthogonal_array.conjugate('csr').to_latin_squares().tolist(),
+            expected)
+
+    def test_orthogonal_array_round_trip(self):
+        orthogonal_array = to_orthogonal_array(self._latin_square)
+        columnar = ColumnarOrthogonalArray.from_orthogonal_array(
+            orthogonal_array)
+        self.assertListEqual(columnar.to_orthogonal_array(), orthogonal_array)
+        self.assertListEqual(columnar.to_latin_squares().tolist(),
+                             self._latin_square)
+        self.assertIsInstance(columnar.to_orthogonal_array()[0], Triple)
+
+    def test_conjugate(self):
+        columnar = ColumnarOrthogonalArray.from_latin_squares(
+            self._latin_square)
+        for name, conjugate in CONJUGATES.items():
+            expected = from_orthogonal_array(
+                permute_orthogonal_array_triple(
+                    to_orthogonal_array(self._latin_square), conjugate))
+            conjugated = columnar.conjugate(name)
+            self.assertListEqual(conjugated.to_latin_squares().tolist(),
+                                 expected)
+        conjugated = columnar.conjugate('src')
+        self.assertIs(conjugated.r, columnar.s)
+        self.assertIs(conjugated.c, columnar.r)
+        self.assertIs(conjugated.s, columnar.c)
+
+    def test_batch(self):
+        latin_squares = np.array([
+            self._latin_square,
+            [row[::-1] for row in self._latin_square],
+            self._latin_square[::-1],
+        ], dtype=np.uint8)
+        columnar = ColumnarOrthogonalArray.from_latin_squares(latin_squares)
+        self.assertEqual(columnar.batch_shape, (3,))
+        conjugated = columnar.conjugate('csr').to_latin_squares()
+        self.assertEqual(conjugated.shape, (3, 4, 4))
+        self.assertEqual(conjugated.dtype, np.uint8)
+        for latin_square, actual in zip(latin_squares.tolist(), conjugated):
+            expected = from_orthogonal_array(
+                permute_orthogonal_array_triple(
+                    to_orthogonal_array(latin_square), csr))
+            self.assertListEqual(actual.tolist(), expected)
+        self.assertRaises(ValueError, columnar.to_orthogonal_array)
+
+    def test_conjugate_chain(self):
+        columnar = ColumnarOrthogonalArray.from_latin_squares(
+            self._latin_square)
+        expected = columnar.conjugate('rsc').conjugate('crs')
+        actual = columnar.conjugate('rsc', 'crs')
+        self.assertListEqual(actual.to_latin_squares().tolist(),
+                             expected.to_latin_squares().tolist())
+        self.assertIs(actual.r, columnar.s)
+
+    def test_get_all_conjugates(self):
+        latin_squares = np.array([
+            self._latin_square,
+            [row[::-1] for row in self._latin_square],
+        ], dtype=np.uint8)
+        conjugates = get_all_conjugates(latin_squares)
+        self.assertEqual(conjugates.shape, (2, 6, 4, 4))
+        self.assertEqual(conjugates.dtype, np.uint8)
+        for latin_square, actual in zip(latin_squares.tolist(), conjugates):
+            for name, conjugate in zip(CONJUGATE_NAMES, actual):
+                expected = from_orthogonal_array(
+                    permute_orthogonal_array_triple(
+                        to_orthogonal_array(latin_square), CONJUGATES[name]))
+                self.assertListEqual(conjugate.tolist(), expected)
+        self.assertRaises(ValueError, get_all_conjugates, latin_squares[0])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError,
+                          ColumnarOrthogonalArray.from_latin_squares,
+                          [[0, 1, 2], [1, 2, 0]])
+        self.assertRaises(ValueError,
+                          ColumnarOrthogonalArray.from_latin_squares, [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+from typing import Iterable, Iterator
+
+
+class DancingLinks:
+
+    def __init__(self, num_columns: int,
+                 rows: Iterable[Iterable[int]]) -> None:
+        self._num_columns = num_columns
+        self._init_headers()
+        self._row_heads: list[int] = []
+        for columns in rows:
+            self._add_row(columns)
+        self._selected: list[int] = []
+
+    def _init_headers(self) -> None:
+        num_headers = self._num_columns + 1
+        self._left = [i - 1 for i in range(num_headers)]
+        self._right = [i + 1 for i in range(num_headers)]
+        self._left[0] = self._num_columns
+        self._right[self._num_columns] = 0
+        self._up = list(range(num_headers))
+        self._down = list(range(num_headers))
+        self._column = list(range(num_headers))
+        self._row = [-1 for _ in range(num_headers)]
+        self._sizes = [0 for _ in range(num_headers)]
+
+    def _add_row(self, columns: Iterable[int]) -> None:
+        row_id = len(self._row_heads)
+        head = -1
+        for column in columns:
+            self._validate_column(column)
+            c = column + 1
+            node = len(self._column)
+            self._column.append(c)
+            self._row.append(row_id)
+            self._up.append(self._up[c])
+            self._down.append(c)
+            self._down[self._up[c]] = node
+            self._up[c] = node
+            self._sizes[c] += 1
+            if head == -1:
+                head = node
+                self._left.append(node)
+                self._right.append(node)
+            else:
+                self._left.append(self._left[head])
+                self._right.append(head)
+                self._right[self._left[head]] = node
+                self._left[head] = node
+        if head == -1:
+            raise ValueError
+        self._row_heads.append(head)
+
+    def _validate_column(self, column: int) -> None:
+        if isinstance(column, int):
+            if 0 <= column < self._num_columns:
+                pass
+            else:
+                raise ValueError
+        else:
+            raise TypeError
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._row_heads)
+
+    def select(self, row_id: int) -> None:
+        node = self._row_heads[row_id]
+        if self._is_covered(node):
+            raise ValueError
+        self._cover(self._column[node])
+        self._cover_row(node)
+        self._selected.append(row_id)
+
+    def _is_covered(self, node: int) -> bool:
+        j = node
+        while True:
+            c = self._column[j]
+            if self._right[self._left[c]] != c or self._down[self._up[
+                    j]] != j:
+                return True
+            j = self._right[j]
+            if j == node:
+                return False
+
+    def get_solutions(self) -> Iterator[list[int]]:
+        if self._right[0] == 0:
+            yield list(self._selected)
+            return
+        choices: list[int] = []
+        c = self._choose_column()
+        self._cover(c)
+        r = self._down[c]
+        while True:
+            if r != c:
+                choices.append(r)
+                self._cover_row(r)
+                if self._right[0] == 0:
+                    yield self._selected + [self._row[j] for j in choices]
+                else:
+                    c = self._choose_column()
+                    self._cover(c)
+                    r = self._down[c]
+                    continue
+                self._uncover_row(r)
+                choices.pop()
+                r = self._down[r]
+            else:
+                self._uncover(c)
+                if not choices:
+                    return
+                r = choices.pop()
+                c = self._column[r]
+                self._uncover_row(r)
+                r = self._down[r]
+
+    def _choose_column(self) -> int:
+        right = self._right
+        sizes = self._sizes
+        best = c = right[0]
+        while c != 0:
+            if sizes[c] < sizes[best]:
+                best = c
+                if sizes[c] <= 1:
+                    break
+            c = right[c]
+        return best
+
+    def _cover(self, c: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column, sizes = self._column, self._sizes
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                sizes[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, c: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column, sizes = self._column, self._sizes
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                sizes[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def _cover_row(self, r: int) -> None:
+        j = self._right[r]
+        while j != r:
+            self._cover(self._column[j])
+            j = self._right[j]
+
+    def _uncover_row(self, r: int) -> None:
+        j = self._left[r]
+        while j != r:
+            self._uncover(self._column[j])
+            j = self._left[j]
@@ -0,0 +1,66 @@
+import unittest
+
+from dancing_links import DancingLinks
+
+
+class DancingLinksTest(unittest.TestCase):
+
+    def setUp(self):
+        # Knuth's example from "Dancing Links": the unique exact cover is
+        # rows 0, 3 and 4.
+        self.rows = [
+            [2, 4, 5],
+            [0, 3, 6],
+            [1, 2, 5],
+            [0, 3],
+            [1, 6],
+            [3, 4, 6],
+        ]
+
+    def test_get_solutions(self):
+        dancing_links = DancingLinks(7, self.rows)
+        actual = [sorted(solution) for solution in dancing_links.get_solutions()]
+        self.assertListEqual(actual, [[0, 3, 4]])
+
+    def test_get_solutions_restores_links(self):
+        dancing_links = DancingLinks(7, self.rows)
+        list(dancing_links.get_solutions())
+        actual = [sorted(solution) for solution in dancing_links.get_solutions()]
+        self.assertListEqual(actual, [[0, 3, 4]])
+
+    def test_get_solutions_all(self):
+        dancing_links = DancingLinks(2, [[0], [1], [0, 1]])
+        actual = [sorted(solution) for solution in dancing_links.get_solutions()]
+        self.assertCountEqual(actual, [[0, 1], [2]])
+
+    def test_get_solutions_none(self):
+        dancing_links = DancingLinks(3, [[0, 1], [1, 2]])
+        self.assertListEqual(list(dancing_links.get_solutions()), [])
+
+    def test_select(self):
+        dancing_links = DancingLinks(7, self.rows)
+        dancing_links.select(3)
+        actual = [sorted(solution) for solution in dancing_links.get_solutions()]
+        self.assertListEqual(actual, [[0, 3, 4]])
+
+    def test_select_conflict(self):
+        dancing_links = DancingLinks(7, self.rows)
+        dancing_links.select(3)
+        self.assertRaises(ValueError, dancing_links.select, 1)
+
+    def test_select_all(self):
+        dancing_links = DancingLinks(2, [[0], [1]])
+        dancing_links.select(0)
+        dancing_links.select(1)
+        self.assertListEqual(list(dancing_links.get_solutions()), [[0, 1]])
+
+    def test_invalid_column(self):
+        self.assertRaises(ValueError, DancingLinks, 2, [[0, 2]])
+        self.assertRaises(TypeError, DancingLinks, 2, [['0']])
+
+    def test_empty_row(self):
+        self.assertRaises(ValueError, DancingLinks, 2, [[]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+from math import factorial
+from typing import Optional, Union, overload
+
+
+def unrank_permutation(rank: int, k: int) -> list[int]:
+    if not 0 <= rank < factorial(k):
+        raise IndexError
+    elements = list(range(k))
+    permutation = []
+    for i in reversed(range(k)):
+        index, rank = divmod(rank, factorial(i))
+        permutation.append(elements.pop(index))
+    return permutation
+
+
+class ExpandedLatinSquares(Sequence):
+
+    def __init__(self,
+                 latin_square: list[list[int]],
+                 subset: str = 'all',
+                 indices: Optional[range] = None) -> None:
+        self._latin_square = [list(row) for row in latin_square]
+        self._subset = subset
+        n = len(latin_square)
+        self._num_row_permutations = factorial(n - 1)
+        if subset == 'reduced':
+            size = 1
+        elif subset == 'symbol_isotropy_classes':
+            size = self._num_row_permutations
+        else:
+            size = factorial(n) * self._num_row_permutations
+        self._indices = range(size) if indices is None else indices
+
+    @property
+    def latin_square(self) -> list[list[int]]:
+        return [list(row) for row in self._latin_square]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> list[list[int]]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ExpandedLatinSquares':
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[list[list[int]], 'ExpandedLatinSquares']:
+        if isinstance(index, slice):
+            return ExpandedLatinSquares(self._latin_square, self._subset,
+                                        self._indices[index])
+        return self._get_latin_square(self._indices[index])
+
+    def _get_latin_square(self, rank: int) -> list[list[int]]:
+        n = len(self._latin_square)
+        symbol_map_rank, row_permutation_rank = divmod(
+            rank, self._num_row_permutations)
+        symbol_map = unrank_permutation(symbol_map_rank, n)
+        row_permutation = unrank_permutation(row_permutation_rank, n - 1)
+        rows = [self._latin_square[0]] + [
+            self._latin_square[i + 1] for i in row_permutation
+        ]
+        return [[symbol_map[s] for s in row] for row in rows]
+
+    def __repr__(self) -> str:
+        return (f'ExpandedLatinSquares({self._latin_square!r}, '
+                f'subset={self._subset!r}, indices={self._indices!r})')
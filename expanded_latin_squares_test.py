@@ -0,0 +1,75 @@
+import unittest
+from itertools import permutations
+
+from expanded_latin_squares import ExpandedLatinSquares, unrank_permutation
+from latin_square_generator import LatinSquareGenerator
+
+
+class ExpandedLatinSquaresTest(unittest.TestCase):
+
+    def test_unrank_permutation(self):
+        for k in range(5):
+            self.assertListEqual(
+                [unrank_permutation(rank, k) for rank in range(len(list(
+                    permutations(range(k)))))],
+                [list(permutation) for permutation in permutations(range(k))])
+        self.assertRaises(IndexError, unrank_permutation, 6, 3)
+
+    def test_len(self):
+        latin_square = [[0, 1, 2, 3], [1, 0, 3, 2], [2, 3, 0, 1],
+                        [3, 2, 1, 0]]
+        self.assertEqual(len(ExpandedLatinSquares(latin_square)), 144)
+        self.assertEqual(
+            len(ExpandedLatinSquares(latin_square, 'symbol_isotropy_classes')),
+            6)
+        self.assertEqual(len(ExpandedLatinSquares(latin_square, 'reduced')),
+                         1)
+
+    def test_matches_get_latin_squares(self):
+        for subset in ('reduced', 'symbol_isotropy_classes', 'all'):
+            expected = list(
+                LatinSquareGenerator(4, subset=subset).get_latin_squares())
+            actual = [
+                latin_square for expansion in LatinSquareGenerator(
+                    4, subset=subset).get_expansions()
+                for latin_square in expansion
+            ]
+            self.assertListEqual(actual, expected)
+
+    def test_getitem(self):
+        latin_square = [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+        expansion = ExpandedLatinSquares(latin_square)
+        expected = list(
+            LatinSquareGenerator(3, subset='all').get_latin_squares())
+        self.assertListEqual(expansion[5], expected[5])
+        self.assertListEqual(expansion[-1], expected[-1])
+        self.assertRaises(IndexError, expansion.__getitem__, 12)
+        self.assertRaises(IndexError, expansion.__getitem__, -13)
+
+    def test_slice(self):
+        latin_square = [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+        expansion = ExpandedLatinSquares(latin_square)
+        expected = list(expansion)
+        view = expansion[3:11:2]
+        self.assertIsInstance(view, ExpandedLatinSquares)
+        self.assertEqual(len(view), 4)
+        self.assertListEqual(list(view), expected[3:11:2])
+        self.assertListEqual(list(view[::-1]), expected[3:11:2][::-1])
+        self.assertListEqual(view[1], expected[5])
+
+    def test_large_order(self):
+        latin_square = [[(r + c) % 9 for c in range(9)] for r in range(9)]
+        expansion = ExpandedLatinSquares(latin_square)
+        self.assertEqual(len(expansion), 362880 * 40320)
+        self.assertListEqual(expansion[0], latin_square)
+        last = expansion[-1]
+        self.assertListEqual(last[0], list(reversed(range(9))))
+        self.assertIn(last, expansion[-2:])
+
+    def test_get_expansions_classes(self):
+        generator = LatinSquareGenerator(4, subset='isotopy_classes')
+        self.assertRaises(ValueError, list, generator.get_expansions())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@ from bitmap_set import BitmapSet, Bounds, Elem
 
 class IntBitmapSet(BitmapSet):
 
+    __slots__ = ()
+
     @classmethod
     def _validate_bounds(cls, bounds: Bounds) -> None:
         if isinstance(bounds, int):
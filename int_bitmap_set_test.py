@@ -1,4 +1,6 @@
+import pickle
 import unittest
+from copy import deepcopy
 
 from int_bitmap_set import IntBitmapSet
 
@@ -72,6 +74,18 @@ class IntBitmapSetTest(unittest.TestCase):
         other.remove(2)
         self.assertTrue(bitmap_set != other)
 
+    def test_slots(self):
+        bitmap_set = IntBitmapSet(4, elems=[0, 1, 2])
+        self.assertFalse(hasattr(bitmap_set, '__dict__'))
+        self.assertFalse(hasattr(bitmap_set._bitmap, '__dict__'))
+
+    def test_pickle(self):
+        bitmap_set = IntBitmapSet(4, elems=[0, 2], validate=False)
+        other = pickle.loads(pickle.dumps(bitmap_set))
+        self.assertEqual(other, bitmap_set)
+        self.assertFalse(other.validate)
+        self.assertFalse(deepcopy(bitmap_set).validate)
+
     # ------- container methods ------------------------------------------------
 
     def test_len(self):
@@ -82,6 +96,13 @@ class IntBitmapSetTest(unittest.TestCase):
         bitmap_set = IntBitmapSet(4, elems=[0, 1, 2])
         self.assertListEqual(list(reversed(bitmap_set)), [2, 1, 0])
 
+    def test_iter_sparse(self):
+        elems = [0, 5, 63, 64, 99]
+        bitmap_set = IntBitmapSet(100, elems=elems)
+        self.assertEqual(len(bitmap_set), 5)
+        self.assertListEqual(list(bitmap_set), elems)
+        self.assertListEqual(list(reversed(bitmap_set)), elems[::-1])
+
     def test_repr(self):
         bitmap_set = IntBitmapSet(4, elems=[0, 1, 2])
         self.assertMultiLineEqual(repr(bitmap_set), '{0, 1, 2}')
@@ -153,11 +174,30 @@ class IntBitmapSetTest(unittest.TestCase):
         bitmap_set.discard(3)
         self.assertListEqual(list(bitmap_set), [0, 1])
 
+    def test_unvalidated(self):
+        bitmap_set = IntBitmapSet(4, elems=[0, 1, 2], validate=False)
+        self.assertFalse(bitmap_set.validate)
+        # same results as the validated set for valid elements
+        bitmap_set.add(3)
+        bitmap_set.discard(0)
+        bitmap_set[1] = False
+        self.assertTrue(2 in bitmap_set)
+        self.assertFalse(0 in bitmap_set)
+        self.assertListEqual(list(bitmap_set), [2, 3])
+        # invalid elements are no longer rejected
+        self.assertFalse(4 in bitmap_set)
+        # derived sets keep the setting
+        self.assertFalse(bitmap_set.copy().validate)
+        self.assertFalse((bitmap_set | bitmap_set).validate)
+
     def test_pop(self):
         bitmap_set = IntBitmapSet(4, elems=[0, 1, 2])
         elem = bitmap_set.pop()
         self.assertEqual(elem, 0)
         self.assertListEqual(list(bitmap_set), [1, 2])
+        bitmap_set.clear()
+        with self.assertRaises(KeyError):
+            bitmap_set.pop()
 
     def test_clear(self):
         bitmap_set = IntBitmapSet(4, elems=[0, 1, 2])
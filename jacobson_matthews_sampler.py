@@ -0,0 +1,144 @@
+import random
+from typing import Iterator, Optional
+
+_EMPTY = -1
+
+
+class JacobsonMatthewsSampler:
+
+    def __init__(self,
+                 n: int,
+                 burn_in: Optional[int] = None,
+                 thinning: Optional[int] = None,
+                 seed: Optional[int] = None,
+                 latin_square: Optional[list[list[int]]] = None) -> None:
+        if n < 1:
+            raise ValueError
+        self._n = n
+        self._burn_in = n**3 if burn_in is None else burn_in
+        self._thinning = 1 if thinning is None else thinning
+        if self._burn_in < 0 or self._thinning < 1:
+            raise ValueError
+        self._random = random.Random(seed)
+        if latin_square is None:
+            latin_square = [[(r + c) % n for c in range(n)] for r in range(n)]
+        self._init_cube(latin_square)
+        self._is_burnt_in = False
+
+    def _init_cube(self, latin_square: list[list[int]]) -> None:
+        n = self._n
+        if len(latin_square) != n or any(len(row) != n for row in latin_square):
+            raise ValueError
+        self._xy = [_EMPTY] * (n * n)
+        self._xz = [_EMPTY] * (n * n)
+        self._yz = [_EMPTY] * (n * n)
+        for x, row in enumerate(latin_square):
+            for y, z in enumerate(row):
+                if (not 0 <= z < n or self._xz[x * n + z] != _EMPTY or
+                        self._yz[y * n + z] != _EMPTY):
+                    raise ValueError
+                self._xy[x * n + y] = z
+                self._xz[x * n + z] = y
+                self._yz[y * n + z] = x
+        self._extra_xy: dict[int, int] = {}
+        self._extra_xz: dict[int, int] = {}
+        self._extra_yz: dict[int, int] = {}
+        self._improper: Optional[tuple[int, int, int]] = None
+
+    def is_proper(self) -> bool:
+        return self._improper is None
+
+    def get_latin_square(self) -> list[list[int]]:
+        if self._improper is not None:
+            raise ValueError
+        n = self._n
+        return [self._xy[x * n:(x + 1) * n] for x in range(n)]
+
+    def get_latin_squares(self,
+                          num_samples: Optional[int] = None
+                         ) -> Iterator[list[list[int]]]:
+        if not self._is_burnt_in:
+            self.run(self._burn_in)
+            self._is_burnt_in = True
+        num_yielded = 0
+        while num_samples is None or num_yielded < num_samples:
+            num_proper_steps = 0
+            while num_proper_steps < self._thinning:
+                self.step()
+                if self._improper is None:
+                    num_proper_steps += 1
+            yield self.get_latin_square()
+            num_yielded += 1
+
+    def run(self, num_steps: int) -> None:
+        for _ in range(num_steps):
+            self.step()
+
+    def step(self) -> None:
+        n = self._n
+        if n < 2:
+            return
+        rng = self._random.randrange
+        if self._improper is None:
+            x = rng(n)
+            y = rng(n)
+            z1 = self._xy[x * n + y]
+            z = rng(n - 1)
+            if z >= z1:
+                z += 1
+            y1 = self._xz[x * n + z]
+            x1 = self._yz[y * n + z]
+        else:
+            x, y, z = self._improper
+            z1 = self._choose(self._xy, self._extra_xy, x * n + y)
+            y1 = self._choose(self._xz, self._extra_xz, x * n + z)
+            x1 = self._choose(self._yz, self._extra_yz, y * n + z)
+        self._increment(x, y, z)
+        self._increment(x, y1, z1)
+        self._increment(x1, y, z1)
+        self._increment(x1, y1, z)
+        self._decrement(x, y, z1)
+        self._decrement(x, y1, z)
+        self._decrement(x1, y, z)
+        self._decrement(x1, y1, z1)
+
+    def _choose(self, line: list[int], extra: dict[int, int],
+                index: int) -> int:
+        if self._random.getrandbits(1):
+            return extra[index]
+        return line[index]
+
+    def _increment(self, x: int, y: int, z: int) -> None:
+        if self._improper == (x, y, z):
+            self._improper = None
+            return
+        n = self._n
+        self._add(self._xy, self._extra_xy, x * n + y, z)
+        self._add(self._xz, self._extra_xz, x * n + z, y)
+        self._add(self._yz, self._extra_yz, y * n + z, x)
+
+    def _decrement(self, x: int, y: int, z: int) -> None:
+        n = self._n
+        index = x * n + y
+        if self._xy[index] != z and self._extra_xy.get(index) != z:
+            self._improper = (x, y, z)
+            return
+        self._discard(self._xy, self._extra_xy, index, z)
+        self._discard(self._xz, self._extra_xz, x * n + z, y)
+        self._discard(self._yz, self._extra_yz, y * n + z, x)
+
+    @staticmethod
+    def _add(line: list[int], extra: dict[int, int], index: int,
+             value: int) -> None:
+        if line[index] == _EMPTY:
+            line[index] = value
+        else:
+            extra[index] = value
+
+    @staticmethod
+    def _discard(line: list[int], extra: dict[int, int], index: int,
+                 value: int) -> None:
+        if line[index] == value:
+            line[index] = extra.pop(index, _EMPTY)
+        else:
+            del extra[index]
@@ -0,0 +1,73 @@
+import unittest
+from collections import Counter
+
+from jacobson_matthews_sampler import JacobsonMatthewsSampler
+
+
+class JacobsonMatthewsSamplerTest(unittest.TestCase):
+
+    def assertLatinSquare(self, latin_square, n):
+        self.assertEqual(len(latin_square), n)
+        for i in range(n):
+            self.assertSetEqual(set(latin_square[i]), set(range(n)))
+            self.assertSetEqual({row[i] for row in latin_square},
+                                set(range(n)))
+
+    def test_get_latin_squares(self):
+        sampler = JacobsonMatthewsSampler(12, seed=0)
+        latin_squares = list(sampler.get_latin_squares(50))
+        self.assertEqual(len(latin_squares), 50)
+        for latin_square in latin_squares:
+            self.assertLatinSquare(latin_square, 12)
+
+    def test_run_keeps_cube_consistent(self):
+        sampler = JacobsonMatthewsSampler(7, seed=1)
+        for _ in range(2000):
+            sampler.step()
+            if sampler.is_proper():
+                self.assertLatinSquare(sampler.get_latin_square(), 7)
+            else:
+                self.assertRaises(ValueError, sampler.get_latin_square)
+
+    def test_seed(self):
+        first = JacobsonMatthewsSampler(8, burn_in=100, seed=3)
+        second = JacobsonMatthewsSampler(8, burn_in=100, seed=3)
+        self.assertListEqual(list(first.get_latin_squares(5)),
+                             list(second.get_latin_squares(5)))
+
+    def test_covers_all_latin_squares(self):
+        for n, num_latin_squares in [(1, 1), (2, 2), (3, 12)]:
+            sampler = JacobsonMatthewsSampler(n,
+                                              burn_in=10,
+                                              thinning=5,
+                                              seed=0)
+            counts = Counter(
+                str(latin_square)
+                for latin_square in sampler.get_latin_squares(1200))
+            self.assertEqual(len(counts), num_latin_squares)
+            for count in counts.values():
+                self.assertAlmostEqual(count,
+                                       1200 / num_latin_squares,
+                                       delta=0.25 * 1200 / num_latin_squares)
+
+    def test_latin_square(self):
+        latin_square = [[0, 2, 1], [1, 0, 2], [2, 1, 0]]
+        sampler = JacobsonMatthewsSampler(3, latin_square=latin_square)
+        self.assertListEqual(sampler.get_latin_square(), latin_square)
+        self.assertRaises(ValueError,
+                          JacobsonMatthewsSampler,
+                          2,
+                          latin_square=[[0, 1], [0, 1]])
+        self.assertRaises(ValueError,
+                          JacobsonMatthewsSampler,
+                          2,
+                          latin_square=[[0, 1]])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, JacobsonMatthewsSampler, 0)
+        self.assertRaises(ValueError, JacobsonMatthewsSampler, 3, thinning=0)
+        self.assertRaises(ValueError, JacobsonMatthewsSampler, 3, burn_in=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from functools import lru_cache
+from itertools import permutations
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def get_permutation_table(n: int) -> np.ndarray:
+    permutation_list = list(permutations(range(n)))
+    return np.array(permutation_list, dtype=np.uint8).reshape(
+        len(permutation_list), n)
+
+
+@lru_cache(maxsize=None)
+def get_row_permutation_table(n: int) -> np.ndarray:
+    table = np.zeros((len(get_permutation_table(n - 1)), n), dtype=np.intp)
+    table[:, 1:] = get_permutation_table(n - 1) + 1
+    return table
+
+
+def expand_latin_square(latin_square: list[list[int]],
+                        subset: str = 'all',
+                        chunk_size: int = 4096) -> Iterator[np.ndarray]:
+    if chunk_size <= 0:
+        raise ValueError
+    n = len(latin_square)
+    square = np.array(latin_square, dtype=np.uint8).reshape(n, n)
+    if subset == 'reduced':
+        yield square[np.newaxis]
+        return
+    row_permuted_squares = square[get_row_permutation_table(n)]
+    if subset == 'symbol_isotropy_classes':
+        for start in range(0, len(row_permuted_squares), chunk_size):
+            yield row_permuted_squares[start:start + chunk_size]
+        return
+    symbol_maps = get_permutation_table(n)
+    num_row_permutations = len(row_permuted_squares)
+    num_latin_squares = len(symbol_maps) * num_row_permutations
+    for start in range(0, num_latin_squares, chunk_size):
+        indices = np.arange(start, min(start + chunk_size, num_latin_squares))
+        symbol_map_indices = indices // num_row_permutations
+        row_permutation_indices = indices % num_row_permutations
+        yield symbol_maps[symbol_map_indices[:, np.newaxis, np.newaxis],
+                          row_permuted_squares[row_permutation_indices]]
+
+
+def stack_latin_squares(latin_squares: Iterable[list[list[int]]],
+                        chunk_size: int = 4096) -> Iterator[np.ndarray]:
+    if chunk_size <= 0:
+        raise ValueError
+    block: list[list[list[int]]] = []
+    for latin_square in latin_squares:
+        block.append(latin_square)
+        if len(block) == chunk_size:
+            yield np.array(block, dtype=np.uint8)
+            block = []
+    if block:
+        yield np.array(block, dtype=np.uint8)
@@ -0,0 +1,59 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from latin_square_arrays import (expand_latin_square,
+                                     get_permutation_table,
+                                     get_row_permutation_table,
+                                     stack_latin_squares)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class LatinSquareArraysTest(unittest.TestCase):
+
+    def test_get_permutation_table(self):
+        table = get_permutation_table(3)
+        self.assertEqual(table.dtype, np.uint8)
+        self.assertListEqual(table.tolist(), [[0, 1, 2], [0, 2, 1], [1, 0, 2],
+                                              [1, 2, 0], [2, 0, 1], [2, 1, 0]])
+        self.assertListEqual(get_row_permutation_table(3).tolist(),
+                             [[0, 1, 2], [0, 2, 1]])
+
+    def test_expand_latin_square(self):
+        latin_square = [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+        blocks = list(expand_latin_square(latin_square, chunk_size=5))
+        self.assertListEqual([len(block) for block in blocks], [5, 5, 2])
+        squares = np.concatenate(blocks).tolist()
+        self.assertEqual(len(squares), 12)
+        self.assertListEqual(squares[0], latin_square)
+        self.assertListEqual(squares[1], [[0, 1, 2], [2, 0, 1], [1, 2, 0]])
+        self.assertListEqual(squares[2], [[0, 2, 1], [2, 1, 0], [1, 0, 2]])
+
+    def test_expand_latin_square_subsets(self):
+        latin_square = [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+        reduced = list(expand_latin_square(latin_square, 'reduced'))
+        self.assertListEqual(np.concatenate(reduced).tolist(), [latin_square])
+        rows = list(
+            expand_latin_square(latin_square, 'symbol_isotropy_classes'))
+        self.assertEqual(np.concatenate(rows).shape, (2, 3, 3))
+
+    def test_stack_latin_squares(self):
+        latin_squares = [[[0, 1], [1, 0]], [[1, 0], [0, 1]], [[0, 1], [1, 0]]]
+        blocks = list(stack_latin_squares(latin_squares, chunk_size=2))
+        self.assertListEqual([block.shape for block in blocks], [(2, 2, 2),
+                                                                 (1, 2, 2)])
+        self.assertListEqual(np.concatenate(blocks).tolist(), latin_squares)
+
+    def test_chunk_size(self):
+        self.assertRaises(ValueError, list,
+                          expand_latin_square([[0]], chunk_size=0))
+        self.assertRaises(ValueError, list,
+                          stack_latin_squares([[[0]]], chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
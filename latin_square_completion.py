@@ -0,0 +1,46 @@
+from typing import Iterator, Optional
+
+from latin_square_generator import SEARCH_NODE_TYPES, get_terminal_nodes
+from search_statistics import SearchStatistics
+
+
+class LatinSquareCompletion:
+
+    def __init__(self,
+                 partial_latin_square: list[list[Optional[int]]],
+                 engine: str = 'bitmask',
+                 in_place: bool = True,
+                 hidden_singles: bool = False) -> None:
+        if engine not in SEARCH_NODE_TYPES:
+            raise ValueError
+        self._in_place = in_place
+        self._search_node = SEARCH_NODE_TYPES[
+            engine].from_partial_latin_square(partial_latin_square,
+                                              in_place=in_place,
+                                              hidden_singles=hidden_singles)
+        self._statistics = SearchStatistics()
+
+    @property
+    def statistics(self) -> SearchStatistics:
+        return self._statistics
+
+    def get_latin_squares(
+            self, limit: Optional[int] = None) -> Iterator[list[list[int]]]:
+        if limit is not None and limit <= 0:
+            return
+        if not self._search_node._is_viable():
+            return
+        num_completions = 0
+        search_nodes = [self._search_node.copy()]
+        for search_node in get_terminal_nodes(search_nodes, self._in_place,
+                                              self._statistics):
+            yield [list(row) for row in search_node.symbols]  # type: ignore
+            num_completions += 1
+            if num_completions == limit:
+                return
+
+    def count(self, limit: Optional[int] = None) -> int:
+        return sum(1 for _ in self.get_latin_squares(limit))
+
+    def has_unique_completion(self) -> bool:
+        return self.count(limit=2) == 1
@@ -0,0 +1,92 @@
+import unittest
+
+from latin_square_completion import LatinSquareCompletion
+
+
+class LatinSquareCompletionTest(unittest.TestCase):
+
+    def test_count_empty(self):
+        for engine in ('set', 'bitmask'):
+            for in_place in (False, True):
+                for hidden_singles in (False, True):
+                    completion = LatinSquareCompletion(
+                        [[None] * 4 for _ in range(4)],
+                        engine=engine,
+                        in_place=in_place,
+                        hidden_singles=hidden_singles)
+                    self.assertEqual(completion.count(), 576)
+
+    def test_order_one(self):
+        for engine in ('set', 'bitmask'):
+            for in_place in (False, True):
+                for hidden_singles in (False, True):
+                    for partial_latin_square in ([[0]], [[None]]):
+                        completion = LatinSquareCompletion(
+                            partial_latin_square,
+                            engine=engine,
+                            in_place=in_place,
+                            hidden_singles=hidden_singles)
+                        self.assertListEqual(
+                            list(completion.get_latin_squares()), [[[0]]])
+        self.assertRaises(ValueError, LatinSquareCompletion, [[1]])
+
+    def test_get_latin_squares(self):
+        partial_latin_square = [
+            [0, None, None, None],
+            [None, 0, None, None],
+            [None, None, 1, None],
+            [None, None, None, None],
+        ]
+        completion = LatinSquareCompletion(partial_latin_square)
+        latin_squares = list(completion.get_latin_squares())
+        self.assertGreater(len(latin_squares), 0)
+        for latin_square in latin_squares:
+            for r, row in enumerate(partial_latin_square):
+                for c, s in enumerate(row):
+                    if s is not None:
+                        self.assertEqual(latin_square[r][c], s)
+            for i in range(4):
+                self.assertSetEqual(set(latin_square[i]), set(range(4)))
+                self.assertSetEqual({row[i] for row in latin_square},
+                                    set(range(4)))
+        self.assertEqual(len(set(map(str, latin_squares))), len(latin_squares))
+
+    def test_limit(self):
+        completion = LatinSquareCompletion([[None] * 5 for _ in range(5)])
+        self.assertEqual(len(list(completion.get_latin_squares(limit=3))), 3)
+        self.assertEqual(completion.count(limit=10), 10)
+        self.assertEqual(completion.count(limit=0), 0)
+
+    def test_has_unique_completion(self):
+        latin_square = [[(r + c) % 6 for c in range(6)] for r in range(6)]
+        partial_latin_square = [list(row) for row in latin_square]
+        partial_latin_square[0][0] = None
+        partial_latin_square[5][5] = None
+        completion = LatinSquareCompletion(partial_latin_square)
+        self.assertTrue(completion.has_unique_completion())
+        self.assertListEqual(list(completion.get_latin_squares()),
+                             [latin_square])
+        completion = LatinSquareCompletion([[None] * 6 for _ in range(6)])
+        self.assertFalse(completion.has_unique_completion())
+
+    def test_no_completion(self):
+        completion = LatinSquareCompletion([
+            [0, 1, None],
+            [1, None, None],
+            [None, None, 2],
+        ])
+        self.assertEqual(completion.count(), 0)
+        self.assertFalse(completion.has_unique_completion())
+
+    def test_conflict(self):
+        self.assertRaises(ValueError, LatinSquareCompletion,
+                          [[0, None], [0, None]])
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError,
+                          LatinSquareCompletion, [[None]],
+                          engine='dlx')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+from typing import Iterator, Optional
+
+from dancing_links import DancingLinks
+from search_statistics import SearchStatistics
+from utils import Triple, _get_empty_latin_square
+
+
+class LatinSquareDancingLinks:
+
+    def __init__(self, n: int) -> None:
+        self._n = n
+        self._triples = [
+            Triple(r=r, c=c, s=s) for r in range(n) for c in range(n)
+            for s in range(n)
+        ]
+        self._dancing_links = DancingLinks(
+            3 * n * n, [self._get_columns(triple) for triple in self._triples])
+        for i in range(n):
+            self._dancing_links.select(self._get_row_id(Triple(r=0, c=i,
+                                                               s=i)))
+        for i in range(1, n):
+            self._dancing_links.select(self._get_row_id(Triple(r=i, c=0,
+                                                               s=i)))
+
+    def _get_columns(self, triple: Triple) -> list[int]:
+        n = self._n
+        return [
+            triple.r * n + triple.c,
+            n * n + triple.r * n + triple.s,
+            2 * n * n + triple.c * n + triple.s,
+        ]
+
+    def _get_row_id(self, triple: Triple) -> int:
+        return (triple.r * self._n + triple.c) * self._n + triple.s
+
+    def get_latin_squares(self) -> Iterator[list[list[int]]]:
+        for solution in self._dancing_links.get_solutions():
+            latin_square = _get_empty_latin_square(self._n)
+            for row_id in solution:
+                triple = self._triples[row_id]
+                latin_square[triple.r][triple.c] = triple.s
+            yield latin_square
+
+    def count(self, statistics: Optional[SearchStatistics] = None) -> int:
+        num_latin_squares = 0
+        for _ in self._dancing_links.get_solutions():
+            num_latin_squares += 1
+            if statistics is not None:
+                statistics.record_terminal_node()
+        return num_latin_squares
@@ -0,0 +1,122 @@
+import mmap
+import struct
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+from utils import (_get_hash_size, from_hash_bytes, from_hash_val,
+                   hash_latin_square, hash_latin_squares_to_bytes)
+
+_MAGIC = b'LSQ1'
+_HEADER = struct.Struct('<4sHH')
+_MAX_ORDER = 255
+
+
+def get_record_size(n: int) -> int:
+    return _get_hash_size(n)
+
+
+class LatinSquareWriter:
+
+    def __init__(self, path: str, n: int) -> None:
+        if not 0 < n <= _MAX_ORDER:
+            raise ValueError
+        self._n = n
+        self._record_size = get_record_size(n)
+        header = _HEADER.pack(_MAGIC, n, self._record_size)
+        self._file: Optional[BinaryIO] = open(path, 'wb')
+        self._file.write(header)
+        self._num_records = 0
+
+    @property
+    def num_records(self) -> int:
+        return self._num_records
+
+    def write(self, latin_square: list[list[int]]) -> None:
+        if self._file is None:
+            raise ValueError
+        if len(latin_square) != self._n:
+            raise ValueError
+        self._file.write(
+            hash_latin_square(latin_square).to_bytes(self._record_size,
+                                                     'big'))
+        self._num_records += 1
+
+    def write_array(self, latin_squares: Any) -> None:
+        if self._file is None:
+            raise ValueError
+        if len(latin_squares) == 0:
+            return
+        if tuple(latin_squares.shape[1:]) != (self._n, self._n):
+            raise ValueError
+        self._file.write(hash_latin_squares_to_bytes(latin_squares))
+        self._num_records += len(latin_squares)
+
+    def write_all(self, latin_squares: Iterable[list[list[int]]]) -> None:
+        for latin_square in latin_squares:
+            self.write(latin_square)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'LatinSquareWriter':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class LatinSquareReader:
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError
+        magic, self._n, self._record_size = _HEADER.unpack_from(self._mmap)
+        if (magic != _MAGIC or self._record_size != get_record_size(self._n)
+                or (len(self._mmap) - _HEADER.size) % self._record_size):
+            self._mmap.close()
+            raise ValueError
+        self._num_records = (len(self._mmap) -
+                             _HEADER.size) // self._record_size
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    def __len__(self) -> int:
+        return self._num_records
+
+    def __getitem__(self, index: int) -> list[list[int]]:
+        return from_hash_val(self.get_hash_val(index), self._n)
+
+    def get_hash_val(self, index: int) -> int:
+        if index < 0:
+            index += self._num_records
+        if not 0 <= index < self._num_records:
+            raise IndexError
+        start = _HEADER.size + index * self._record_size
+        return int.from_bytes(self._mmap[start:start + self._record_size],
+                              'big')
+
+    def get_array(self, start: int = 0, stop: Optional[int] = None) -> Any:
+        start, stop, _ = slice(start, stop).indices(self._num_records)
+        stop = max(start, stop)
+        return from_hash_bytes(
+            self._mmap[_HEADER.size + start * self._record_size:_HEADER.size +
+                       stop * self._record_size], self._n)
+
+    def __iter__(self) -> Iterator[list[list[int]]]:
+        for index in range(self._num_records):
+            yield self[index]
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> 'LatinSquareReader':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
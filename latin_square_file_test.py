@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+
+from latin_square_file import (_MAX_ORDER, LatinSquareReader,
+                               LatinSquareWriter, get_record_size)
+from latin_square_generator import LatinSquareGenerator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LatinSquareFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._temp_dir.name, 'latin_squares.bin')
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_get_record_size(self):
+        self.assertEqual(get_record_size(1), 1)
+        self.assertEqual(get_record_size(2), 1)
+        self.assertEqual(get_record_size(4), 4)
+        self.assertEqual(get_record_size(7), 18)
+        self.assertLess(get_record_size(_MAX_ORDER), 1 << 16)
+        self.assertGreaterEqual(get_record_size(_MAX_ORDER + 1), 1 << 16)
+
+    def test_write_read(self):
+        latin_squares = list(
+            LatinSquareGenerator(4, subset='symbol_isotropy_classes')
+            .get_latin_squares())
+        with LatinSquareWriter(self._path, 4) as writer:
+            writer.write_all(latin_squares)
+            self.assertEqual(writer.num_records, len(latin_squares))
+        self.assertEqual(os.path.getsize(self._path),
+                         8 + 4 * len(latin_squares))
+        with LatinSquareReader(self._path) as reader:
+            self.assertEqual(reader.n, 4)
+            self.assertEqual(len(reader), len(latin_squares))
+            self.assertListEqual(list(reader), latin_squares)
+            self.assertListEqual(reader[3], latin_squares[3])
+            self.assertListEqual(reader[-1], latin_squares[-1])
+            self.assertRaises(IndexError, reader.__getitem__,
+                              len(latin_squares))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_write_read_arrays(self):
+        generator = LatinSquareGenerator(5, subset='symbol_isotropy_classes')
+        blocks = list(generator.get_latin_squares(as_arrays=True,
+                                                  chunk_size=100))
+        with LatinSquareWriter(self._path, 5) as writer:
+            for block in blocks:
+                writer.write_array(block)
+            writer.write_array(blocks[0][:0])
+        latin_squares = np.concatenate(blocks)
+        with LatinSquareReader(self._path) as reader:
+            self.assertEqual(len(reader), 1344)
+            self.assertListEqual(reader.get_array().tolist(),
+                                 latin_squares.tolist())
+            self.assertListEqual(reader.get_array(10, 20).tolist(),
+                                 latin_squares[10:20].tolist())
+            self.assertEqual(reader.get_array(20, 10).shape, (0, 5, 5))
+            self.assertListEqual(reader[700], latin_squares[700].tolist())
+
+    def test_empty(self):
+        with LatinSquareWriter(self._path, 5):
+            pass
+        with LatinSquareReader(self._path) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertListEqual(list(reader), [])
+
+    def test_invalid_file(self):
+        with open(self._path, 'wb') as f:
+            f.write(b'not a latin square file')
+        self.assertRaises(ValueError, LatinSquareReader, self._path)
+
+    def test_truncated_file(self):
+        with LatinSquareWriter(self._path, 3) as writer:
+            writer.write([[0, 1, 2], [1, 2, 0], [2, 0, 1]])
+        with open(self._path, 'ab') as f:
+            f.write(b'\x00')
+        self.assertRaises(ValueError, LatinSquareReader, self._path)
+
+    def test_invalid_order(self):
+        for n in (0, _MAX_ORDER + 1):
+            self.assertRaises(ValueError, LatinSquareWriter, self._path, n)
+            self.assertFalse(os.path.exists(self._path))
+        with LatinSquareWriter(self._path, _MAX_ORDER) as writer:
+            self.assertEqual(writer.num_records, 0)
+        with LatinSquareReader(self._path) as reader:
+            self.assertEqual(reader.n, _MAX_ORDER)
+
+    def test_write_wrong_order(self):
+        with LatinSquareWriter(self._path, 3) as writer:
+            self.assertRaises(ValueError, writer.write, [[0, 1], [1, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
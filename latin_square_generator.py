@@ -1,27 +1,473 @@
+import json
+import os
+from functools import partial
 from itertools import permutations
+from math import factorial
+from multiprocessing import Pool
+
+from bitmask_latin_square_search_node import BitmaskLatinSquareSearchNode
+from expanded_latin_squares import ExpandedLatinSquares
+from latin_square_dancing_links import LatinSquareDancingLinks
+from latin_square_orderly_search import LatinSquareOrderlySearch
 from latin_square_search_node import LatinSquareSearchNode
+from search_statistics import SearchStatistics
+from utils import hash_latin_square
+from tree_size_estimator import estimate_forest_size
+
+_OPEN_CELL = 255
+
+CLASS_SUBSETS = ('isotopy_classes', 'main_classes')
+
+SEARCH_NODE_TYPES = {
+    'set': LatinSquareSearchNode,
+    'bitmask': BitmaskLatinSquareSearchNode,
+}
 
 
 class LatinSquareGenerator:
-    def __init__(self, n, subset='all', **kwargs):
+    def __init__(self,
+                 n,
+                 subset='all',
+                 engine='set',
+                 in_place=False,
+                 hidden_singles=False,
+                 processes=None,
+                 split_depth=None,
+                 ordered=True,
+                 shard_index=None,
+                 shard_count=None,
+                 checkpoint_path=None,
+                 checkpoint_interval=10000,
+                 callback=None,
+                 callback_interval=10000,
+                 progress_reporter=None,
+                 collect_statistics=False,
+                 **kwargs):
+        if engine not in SEARCH_NODE_TYPES and engine != 'dlx':
+            raise ValueError
+        if engine == 'dlx' and processes is not None:
+            raise ValueError
+        if checkpoint_path is not None and (engine == 'dlx' or
+                                            processes is not None):
+            raise ValueError
+        if engine == 'dlx' and progress_reporter is not None:
+            raise ValueError
+        if subset in CLASS_SUBSETS and (
+                processes is not None or shard_count is not None or
+                checkpoint_path is not None or progress_reporter is not None):
+            raise ValueError
+        self._validate_shard(engine, shard_index, shard_count)
         self._n = n
         self._subset = subset
-        self._search_nodes = [LatinSquareSearchNode(n)]
+        self._engine = engine
+        self._in_place = in_place
+        self._processes = processes
+        self._split_depth = split_depth
+        self._ordered = ordered
+        self._shard_index = shard_index
+        self._shard_count = shard_count
+        self._hidden_singles = hidden_singles
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._num_emitted = 0
+        self._terminal_node = None
+        self._statistics = SearchStatistics()
+        self._callback = callback
+        self._callback_interval = callback_interval
+        self._record_expansions = collect_statistics or callback is not None
+        self._num_reported_terminal_nodes = None
+        self._progress_reporter = progress_reporter
+        self._total_weight = 1.0
+        if engine == 'dlx':
+            self._search_nodes = []
+        else:
+            search_node_type = SEARCH_NODE_TYPES[engine]
+            self._search_nodes = [
+                search_node_type(n,
+                                 in_place=in_place,
+                                 hidden_singles=hidden_singles)
+            ]
 
-    def get_latin_squares(self):
-        while self._search_nodes:
-            search_node = self._search_nodes.pop()
-            for child_node in search_node.get_children():
-                if child_node.is_terminal():
-                    latin_square = child_node.symbols
-                    if self._subset == 'reduced':
-                        yield latin_square
-                    elif self._subset == 'symbol_isotropy_classes':
-                        yield from self._get_row_permutations(latin_square)
-                    else:
-                        yield from self._get_all_permutations(latin_square)
+    @staticmethod
+    def _validate_shard(engine, shard_index, shard_count):
+        if shard_index is None and shard_count is None:
+            return
+        if engine == 'dlx':
+            raise ValueError
+        if isinstance(shard_index, int) and isinstance(shard_count, int):
+            if 0 <= shard_index < shard_count:
+                pass
+            else:
+                raise ValueError
+        else:
+            raise TypeError
+
+    @classmethod
+    def resume(cls,
+               checkpoint_path,
+               checkpoint_interval=10000,
+               callback=None,
+               callback_interval=10000,
+               progress_reporter=None,
+               collect_statistics=False):
+        with open(checkpoint_path, 'rb') as f:
+            header = json.loads(f.readline())
+            packed_partial_latin_squares = f.read()
+        n = header['n']
+        generator = cls(n,
+                        subset=header['subset'],
+                        engine=header['engine'],
+                        in_place=header['in_place'],
+                        hidden_singles=header['hidden_singles'],
+                        checkpoint_path=checkpoint_path,
+                        checkpoint_interval=checkpoint_interval,
+                        callback=callback,
+                        callback_interval=callback_interval,
+                        progress_reporter=progress_reporter,
+                        collect_statistics=collect_statistics)
+        search_node_type = SEARCH_NODE_TYPES[header['engine']]
+        generator._search_nodes = []
+        for packed_partial_latin_square in _unpack_latin_squares(
+                packed_partial_latin_squares, n):
+            search_node = search_node_type(
+                n,
+                in_place=header['in_place'],
+                hidden_singles=header['hidden_singles'])
+            search_node._set_symbols(
+                [[None if s == _OPEN_CELL else s for s in row]
+                 for row in packed_partial_latin_square])
+            generator._search_nodes.append(search_node)
+        for search_node in generator._search_nodes:
+            search_node._weight = 1 / len(generator._search_nodes)
+        generator._num_emitted = header['num_emitted']
+        return generator
+
+    @property
+    def num_emitted(self):
+        return self._num_emitted
+
+    @property
+    def statistics(self):
+        return self._statistics
+
+    def get_latin_squares(self,
+                          as_arrays=False,
+                          chunk_size=4096,
+                          with_hashes=False):
+        if as_arrays:
+            yield from self._get_latin_square_arrays(chunk_size)
+            return
+        if self._subset in CLASS_SUBSETS:
+            for latin_square in self._get_class_representatives():
+                self._num_emitted += 1
+                if with_hashes:
+                    yield hash_latin_square(latin_square), latin_square
                 else:
-                    self._search_nodes.append(child_node)
+                    yield latin_square
+            return
+        num_terminal_nodes = 0
+        for hash_val, latin_square in (
+                self._get_reduced_latin_squares_with_hashes(
+                    with_hashes and self._subset == 'reduced')):
+            if self._subset == 'reduced':
+                latin_squares = [latin_square]
+            elif self._subset == 'symbol_isotropy_classes':
+                latin_squares = self._get_row_permutations(latin_square)
+            else:
+                latin_squares = self._get_all_permutations(latin_square)
+            for latin_square in latin_squares:
+                self._num_emitted += 1
+                if not with_hashes:
+                    yield latin_square
+                elif self._subset == 'reduced':
+                    yield hash_val, latin_square
+                else:
+                    yield hash_latin_square(latin_square), latin_square
+            num_terminal_nodes += 1
+            if (self._checkpoint_path is not None and
+                    num_terminal_nodes % self._checkpoint_interval == 0):
+                self._write_checkpoint()
+        if self._checkpoint_path is not None:
+            self._terminal_node = None
+            self._write_checkpoint()
+
+    def get_hashes(self):
+        for hash_val, _ in self.get_latin_squares(with_hashes=True):
+            yield hash_val
+
+    def get_expansions(self):
+        if self._subset in CLASS_SUBSETS:
+            raise ValueError
+        num_terminal_nodes = 0
+        for latin_square in self._get_reduced_latin_squares():
+            expansion = ExpandedLatinSquares(latin_square, self._subset)
+            self._num_emitted += len(expansion)
+            yield expansion
+            num_terminal_nodes += 1
+            if (self._checkpoint_path is not None and
+                    num_terminal_nodes % self._checkpoint_interval == 0):
+                self._write_checkpoint()
+        if self._checkpoint_path is not None:
+            self._terminal_node = None
+            self._write_checkpoint()
+
+    def _get_latin_square_arrays(self, chunk_size):
+        from latin_square_arrays import expand_latin_square, stack_latin_squares
+        if self._subset in CLASS_SUBSETS:
+            for block in stack_latin_squares(self._get_class_representatives(),
+                                             chunk_size):
+                self._num_emitted += len(block)
+                yield block
+            return
+        if self._subset == 'reduced':
+            blocks = stack_latin_squares(self._get_reduced_latin_squares(),
+                                         chunk_size)
+        else:
+            blocks = (block
+                      for latin_square in self._get_reduced_latin_squares()
+                      for block in expand_latin_square(
+                          latin_square, self._subset, chunk_size))
+        multiplier = self._get_multiplier()
+        num_terminal_nodes = 0
+        num_expanded = 0
+        for block in blocks:
+            self._num_emitted += len(block)
+            yield block
+            num_expanded += len(block)
+            if num_expanded < multiplier:
+                continue
+            num_terminal_nodes += num_expanded // multiplier
+            num_expanded = 0
+            if (self._checkpoint_path is not None and
+                    num_terminal_nodes >= self._checkpoint_interval):
+                num_terminal_nodes = 0
+                self._write_checkpoint()
+        if self._checkpoint_path is not None:
+            self._terminal_node = None
+            self._write_checkpoint()
+
+    def _write_checkpoint(self):
+        partial_latin_squares = [
+            search_node.get_partial_latin_square()
+            for search_node in self._search_nodes
+        ]
+        if self._terminal_node is not None:
+            partial_latin_squares.extend(
+                self._terminal_node._get_unexplored_partial_latin_squares())
+        header = {
+            'n': self._n,
+            'subset': self._subset,
+            'engine': self._engine,
+            'in_place': self._in_place,
+            'hidden_singles': self._hidden_singles,
+            'num_emitted': self._num_emitted,
+        }
+        temp_path = self._checkpoint_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b'\n')
+            f.write(
+                bytes(_OPEN_CELL if s is None else s
+                      for partial_latin_square in partial_latin_squares
+                      for row in partial_latin_square for s in row))
+        os.replace(temp_path, self._checkpoint_path)
+
+    def estimate_tree_size(self, num_probes=1000, seed=None):
+        if self._engine == 'dlx':
+            raise ValueError
+        if self._shard_count is not None:
+            self._shard_search_nodes()
+        return estimate_forest_size(self._search_nodes, num_probes, seed)
+
+    def count(self):
+        if self._subset in CLASS_SUBSETS:
+            return sum(1 for _ in self._get_class_representatives())
+        return self._count_reduced_latin_squares() * self._get_multiplier()
+
+    def _get_class_representatives(self):
+        orderly_search = LatinSquareOrderlySearch(
+            self._n, main_classes=self._subset == 'main_classes')
+        for latin_square in orderly_search.get_latin_squares():
+            self._statistics.record_terminal_node()
+            yield latin_square
+        self._call_callback()
+
+    def _get_multiplier(self):
+        if self._subset == 'reduced':
+            return 1
+        elif self._subset == 'symbol_isotropy_classes':
+            return factorial(self._n - 1)
+        else:
+            return factorial(self._n) * factorial(self._n - 1)
+
+    def _count_reduced_latin_squares(self):
+        if self._shard_count is not None:
+            self._shard_search_nodes()
+        if self._engine == 'dlx':
+            count = LatinSquareDancingLinks(self._n).count(self._statistics)
+            self._call_callback()
+            return count
+        elif self._processes is not None:
+            return self._count_in_parallel()
+        else:
+            return sum(1 for _ in self._get_terminal_nodes())
+
+    def _count_in_parallel(self):
+        frontier = self._get_frontier(self._split_depth,
+                                      8 * self._processes)
+        self._search_nodes = []
+        count_subtree = partial(_count_subtree, self._in_place,
+                                self._record_expansions)
+        num_latin_squares = 0
+        self._start_progress(frontier)
+        explored_weight = 0.0
+        with Pool(self._processes) as pool:
+            for count, statistics, weight in pool.imap_unordered(
+                    count_subtree, frontier):
+                num_latin_squares += count
+                self._merge_statistics(statistics)
+                explored_weight += weight
+                self._report_progress(self._total_weight - explored_weight)
+        self._call_callback()
+        self._report_progress(0.0, force=True)
+        return num_latin_squares
+
+    def _get_reduced_latin_squares(self):
+        for _, latin_square in self._get_reduced_latin_squares_with_hashes(
+                with_hashes=False):
+            yield latin_square
+
+    def _get_reduced_latin_squares_with_hashes(self, with_hashes=True):
+        if self._shard_count is not None:
+            self._shard_search_nodes()
+        if self._engine == 'dlx':
+            yield from _add_hashes(self._get_dancing_links_latin_squares(),
+                                   with_hashes)
+        elif self._processes is not None:
+            yield from _add_hashes(self._search_in_parallel(), with_hashes)
+        elif self._in_place:
+            for search_node in self._get_terminal_nodes():
+                self._terminal_node = search_node
+                yield search_node.hash_val, [
+                    list(row) for row in search_node.symbols
+                ]
+        else:
+            for search_node in self._get_terminal_nodes():
+                yield search_node.hash_val, search_node.symbols
+
+    def _get_dancing_links_latin_squares(self):
+        for latin_square in LatinSquareDancingLinks(
+                self._n).get_latin_squares():
+            self._statistics.record_terminal_node()
+            yield latin_square
+            if self._statistics.terminal_nodes % self._callback_interval == 0:
+                self._call_callback()
+        self._call_callback()
+
+    def _search_in_parallel(self):
+        frontier = self._get_frontier(self._split_depth,
+                                      8 * self._processes)
+        self._search_nodes = []
+        search_subtree = partial(_search_subtree, self._in_place,
+                                 self._record_expansions)
+        self._start_progress(frontier)
+        explored_weight = 0.0
+        with Pool(self._processes) as pool:
+            if self._ordered:
+                results = pool.imap(search_subtree, frontier)
+            else:
+                results = pool.imap_unordered(search_subtree, frontier)
+            for packed_latin_squares, statistics, weight in results:
+                self._merge_statistics(statistics)
+                explored_weight += weight
+                yield from _unpack_latin_squares(packed_latin_squares,
+                                                 self._n)
+                self._report_progress(self._total_weight - explored_weight)
+        self._call_callback()
+        self._report_progress(0.0, force=True)
+
+    def _merge_statistics(self, statistics):
+        num_terminal_nodes = self._statistics.terminal_nodes
+        self._statistics.merge(statistics)
+        if (self._statistics.terminal_nodes // self._callback_interval >
+                num_terminal_nodes // self._callback_interval):
+            self._call_callback()
+
+    def _call_callback(self):
+        if self._callback is None:
+            return
+        if self._statistics.terminal_nodes == self._num_reported_terminal_nodes:
+            return
+        self._num_reported_terminal_nodes = self._statistics.terminal_nodes
+        self._callback(self._statistics)
+
+    def _start_progress(self, search_nodes):
+        if self._progress_reporter is None:
+            return
+        self._total_weight = sum(search_node.weight
+                                 for search_node in search_nodes)
+        self._progress_reporter.start()
+
+    def _report_progress(self, unexplored_weight, force=False):
+        if self._progress_reporter is None:
+            return
+        if force or self._progress_reporter.is_due():
+            if self._total_weight > 0:
+                fraction_done = 1 - unexplored_weight / self._total_weight
+            else:
+                fraction_done = 1.0
+            self._progress_reporter.report(
+                min(max(fraction_done, 0.0), 1.0),
+                self._statistics.terminal_nodes)
+
+    def _get_unexplored_weight(self, terminal_node):
+        unexplored_weight = sum(search_node.weight
+                                for search_node in self._search_nodes)
+        if self._in_place:
+            unexplored_weight += terminal_node._get_unexplored_weight()
+        return unexplored_weight
+
+    def _shard_search_nodes(self):
+        frontier = self._get_frontier(None, 16 * self._shard_count)
+        self._search_nodes = frontier[self._shard_index::self._shard_count]
+        self._shard_count = None
+
+    def _get_frontier(self, split_depth, min_size):
+        statistics = self._statistics if self._record_expansions else None
+        frontier = list(self._search_nodes)
+        depth = 0
+        while (len(frontier) < min_size
+               if split_depth is None else depth < split_depth):
+            if all(search_node.is_terminal() for search_node in frontier):
+                break
+            next_frontier = []
+            for search_node in frontier:
+                if search_node.is_terminal():
+                    next_frontier.append(search_node)
+                elif self._in_place:
+                    next_frontier.extend(
+                        child_node.copy()
+                        for child_node in search_node.get_children(statistics))
+                else:
+                    next_frontier.extend(search_node.get_children(statistics))
+            frontier = next_frontier
+            depth += 1
+        return frontier
+
+    def _get_terminal_nodes(self):
+        self._start_progress(self._search_nodes)
+        for search_node in get_terminal_nodes(self._search_nodes,
+                                              self._in_place,
+                                              self._statistics,
+                                              self._record_expansions):
+            yield search_node
+            if self._statistics.terminal_nodes % self._callback_interval == 0:
+                self._call_callback()
+            if (self._progress_reporter is not None and
+                    self._progress_reporter.is_due()):
+                self._report_progress(self._get_unexplored_weight(search_node),
+                                      force=True)
+        self._call_callback()
+        self._report_progress(0.0, force=True)
 
     def _get_all_permutations(self, latin_square):
         for symbol_map in permutations(range(self._n)):
@@ -31,3 +477,78 @@ class LatinSquareGenerator:
     def _get_row_permutations(self, latin_square):
         for permuted_rows in permutations(latin_square[1:]):
             yield [latin_square[0]] + list(permuted_rows)
+
+
+def get_terminal_nodes(search_nodes,
+                       in_place,
+                       statistics,
+                       record_expansions=True):
+    expansion_statistics = statistics if record_expansions else None
+    if in_place:
+        yield from _get_terminal_nodes_in_place(search_nodes, statistics,
+                                                expansion_statistics)
+        return
+    while search_nodes:
+        search_node = search_nodes.pop()
+        if search_node.is_terminal():
+            statistics.record_terminal_node()
+            yield search_node
+        else:
+            search_nodes.extend(
+                search_node.get_children(expansion_statistics))
+
+
+def _get_terminal_nodes_in_place(search_nodes, statistics,
+                                 expansion_statistics):
+    while search_nodes:
+        search_node = search_nodes.pop()
+        if search_node.is_terminal():
+            statistics.record_terminal_node()
+            yield search_node
+            continue
+        children = [search_node.get_children(expansion_statistics)]
+        while children:
+            for child_node in children[-1]:
+                if child_node.is_terminal():
+                    statistics.record_terminal_node()
+                    yield child_node
+                else:
+                    children.append(
+                        child_node.get_children(expansion_statistics))
+                    break
+            else:
+                children.pop()
+
+
+def _search_subtree(in_place, record_expansions, search_node):
+    statistics = SearchStatistics()
+    weight = search_node.weight
+    search_nodes = get_terminal_nodes([search_node], in_place, statistics,
+                                      record_expansions)
+    packed_latin_squares = bytes(s for search_node in search_nodes
+                                 for row in search_node.symbols for s in row)
+    return packed_latin_squares, statistics, weight
+
+
+def _count_subtree(in_place, record_expansions, search_node):
+    statistics = SearchStatistics()
+    weight = search_node.weight
+    search_nodes = get_terminal_nodes([search_node], in_place, statistics,
+                                      record_expansions)
+    return sum(1 for _ in search_nodes), statistics, weight
+
+
+def _add_hashes(latin_squares, with_hashes):
+    for latin_square in latin_squares:
+        if with_hashes:
+            yield hash_latin_square(latin_square), latin_square
+        else:
+            yield None, latin_square
+
+
+def _unpack_latin_squares(packed_latin_squares, n):
+    for i in range(0, len(packed_latin_squares), n * n):
+        yield [
+            list(packed_latin_squares[j:j + n])
+            for j in range(i, i + n * n, n)
+        ]
@@ -1,6 +1,15 @@
+import os
+import tempfile
 import unittest
 
 from latin_square_generator import LatinSquareGenerator
+from progress_reporter import ProgressReporter
+from utils import hash_latin_square
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class LatinSquareGeneratorTest(unittest.TestCase):
@@ -31,6 +40,548 @@ class LatinSquareGeneratorTest(unittest.TestCase):
         ])
         self.assertCountEqual(actual, expected)
 
+    def test_get_reduced_latin_squares_in_place(self):
+        for n in range(2, 6):
+            generator = LatinSquareGenerator(n, subset='reduced')
+            in_place_generator = LatinSquareGenerator(n,
+                                                      subset='reduced',
+                                                      in_place=True)
+            self.assertCountEqual(list(in_place_generator.get_latin_squares()),
+                                  list(generator.get_latin_squares()))
+
+    def test_get_reduced_latin_squares_bitmask(self):
+        for n in range(2, 6):
+            for in_place in (False, True):
+                generator = LatinSquareGenerator(n, subset='reduced')
+                bitmask_generator = LatinSquareGenerator(n,
+                                                         subset='reduced',
+                                                         engine='bitmask',
+                                                         in_place=in_place)
+                self.assertCountEqual(
+                    list(bitmask_generator.get_latin_squares()),
+                    list(generator.get_latin_squares()))
+
+    def test_get_reduced_latin_squares_hidden_singles(self):
+        for engine in ('set', 'bitmask'):
+            for in_place in (False, True):
+                generator = LatinSquareGenerator(5, subset='reduced')
+                hidden_singles_generator = LatinSquareGenerator(
+                    5,
+                    subset='reduced',
+                    engine=engine,
+                    in_place=in_place,
+                    hidden_singles=True)
+                actual = list(hidden_singles_generator.get_latin_squares())
+                self.assertEqual(len(actual), 56)
+                self.assertCountEqual(actual,
+                                      list(generator.get_latin_squares()))
+
+    def test_get_reduced_latin_squares_dlx(self):
+        for n in range(1, 6):
+            generator = LatinSquareGenerator(n, subset='reduced')
+            dlx_generator = LatinSquareGenerator(n,
+                                                 subset='reduced',
+                                                 engine='dlx')
+            self.assertCountEqual(list(dlx_generator.get_latin_squares()),
+                                  list(generator.get_latin_squares()))
+
+    def test_get_all_latin_squares_dlx(self):
+        generator = LatinSquareGenerator(3, subset='all')
+        dlx_generator = LatinSquareGenerator(3, subset='all', engine='dlx')
+        self.assertCountEqual(list(dlx_generator.get_latin_squares()),
+                              list(generator.get_latin_squares()))
+
+    def test_get_reduced_latin_squares_in_parallel(self):
+        for in_place in (False, True):
+            for ordered in (False, True):
+                for split_depth in (None, 0, 2):
+                    generator = LatinSquareGenerator(5, subset='reduced')
+                    parallel_generator = LatinSquareGenerator(
+                        5,
+                        subset='reduced',
+                        in_place=in_place,
+                        processes=2,
+                        split_depth=split_depth,
+                        ordered=ordered)
+                    self.assertCountEqual(
+                        list(parallel_generator.get_latin_squares()),
+                        list(generator.get_latin_squares()))
+
+    def test_get_latin_squares_in_parallel_ordered(self):
+        first = LatinSquareGenerator(5,
+                                     subset='reduced',
+                                     processes=2,
+                                     split_depth=2)
+        second = LatinSquareGenerator(5,
+                                      subset='reduced',
+                                      processes=3,
+                                      split_depth=2)
+        self.assertListEqual(list(first.get_latin_squares()),
+                             list(second.get_latin_squares()))
+
+    def test_get_all_latin_squares_in_parallel(self):
+        generator = LatinSquareGenerator(3, subset='all')
+        parallel_generator = LatinSquareGenerator(3, subset='all', processes=2)
+        self.assertCountEqual(list(parallel_generator.get_latin_squares()),
+                              list(generator.get_latin_squares()))
+
+    def test_get_latin_squares_sharded(self):
+        for in_place in (False, True):
+            actual = []
+            for shard_index in range(3):
+                generator = LatinSquareGenerator(5,
+                                                 subset='reduced',
+                                                 in_place=in_place,
+                                                 shard_index=shard_index,
+                                                 shard_count=3)
+                latin_squares = list(generator.get_latin_squares())
+                self.assertGreater(len(latin_squares), 0)
+                actual.extend(latin_squares)
+            generator = LatinSquareGenerator(5, subset='reduced')
+            self.assertCountEqual(actual, list(generator.get_latin_squares()))
+
+    def test_get_latin_squares_sharded_is_deterministic(self):
+        first = LatinSquareGenerator(5,
+                                     subset='reduced',
+                                     shard_index=1,
+                                     shard_count=4)
+        second = LatinSquareGenerator(5,
+                                      subset='reduced',
+                                      shard_index=1,
+                                      shard_count=4)
+        self.assertListEqual(list(first.get_latin_squares()),
+                             list(second.get_latin_squares()))
+
+    def test_get_latin_squares_sharded_in_parallel(self):
+        actual = []
+        for shard_index in range(2):
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             processes=2,
+                                             shard_index=shard_index,
+                                             shard_count=2)
+            actual.extend(generator.get_latin_squares())
+        generator = LatinSquareGenerator(5, subset='reduced')
+        self.assertCountEqual(actual, list(generator.get_latin_squares()))
+
+    def test_invalid_shard(self):
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          shard_index=2,
+                          shard_count=2)
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          shard_index=-1,
+                          shard_count=2)
+        self.assertRaises(TypeError, LatinSquareGenerator, 4, shard_count=2)
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          engine='dlx',
+                          shard_index=0,
+                          shard_count=2)
+
+    def test_count(self):
+        expected = {
+            'reduced': [1, 1, 1, 4, 56],
+            'symbol_isotropy_classes': [1, 1, 2, 24, 1344],
+            'all': [1, 2, 12, 576, 161280],
+        }
+        for subset, counts in expected.items():
+            for n, count in enumerate(counts, start=1):
+                for engine in ('set', 'bitmask', 'dlx'):
+                    generator = LatinSquareGenerator(n,
+                                                     subset=subset,
+                                                     engine=engine)
+                    self.assertEqual(generator.count(), count)
+                generator = LatinSquareGenerator(n,
+                                                 subset=subset,
+                                                 in_place=True)
+                self.assertEqual(generator.count(), count)
+
+    def test_count_matches_get_latin_squares(self):
+        for subset in ('reduced', 'symbol_isotropy_classes', 'all'):
+            generator = LatinSquareGenerator(4, subset=subset)
+            expected = len(list(generator.get_latin_squares()))
+            generator = LatinSquareGenerator(4, subset=subset)
+            self.assertEqual(generator.count(), expected)
+
+    def test_count_in_parallel(self):
+        for in_place in (False, True):
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             in_place=in_place,
+                                             processes=2)
+            self.assertEqual(generator.count(), 56)
+
+    def test_count_sharded(self):
+        counts = [
+            LatinSquareGenerator(5,
+                                 subset='reduced',
+                                 shard_index=shard_index,
+                                 shard_count=3).count()
+            for shard_index in range(3)
+        ]
+        self.assertEqual(sum(counts), 56)
+
+    def test_resume(self):
+        for in_place in (False, True):
+            for engine in ('set', 'bitmask'):
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+                    generator = LatinSquareGenerator(
+                        5,
+                        subset='symbol_isotropy_classes',
+                        engine=engine,
+                        in_place=in_place,
+                        checkpoint_path=checkpoint_path,
+                        checkpoint_interval=7)
+                    output = []
+                    for latin_square in generator.get_latin_squares():
+                        output.append([list(row) for row in latin_square])
+                        if len(output) == 500:
+                            break
+                    resumed_generator = LatinSquareGenerator.resume(
+                        checkpoint_path, checkpoint_interval=7)
+                    self.assertLess(resumed_generator.num_emitted, 500)
+                    output = output[:resumed_generator.num_emitted]
+                    output.extend(resumed_generator.get_latin_squares())
+                    self.assertEqual(len(output), 1344)
+                    generator = LatinSquareGenerator(
+                        5, subset='symbol_isotropy_classes')
+                    self.assertCountEqual(output,
+                                          list(generator.get_latin_squares()))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_get_latin_squares_as_arrays(self):
+        for subset in ('reduced', 'symbol_isotropy_classes', 'all',
+                       'isotopy_classes'):
+            generator = LatinSquareGenerator(4, subset=subset)
+            blocks = list(generator.get_latin_squares(as_arrays=True,
+                                                      chunk_size=7))
+            for block in blocks:
+                self.assertEqual(block.dtype, np.uint8)
+                self.assertLessEqual(len(block), 7)
+            expected = list(
+                LatinSquareGenerator(4, subset=subset).get_latin_squares())
+            self.assertListEqual(np.concatenate(blocks).tolist(), expected)
+            self.assertEqual(generator.num_emitted, len(expected))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_resume_as_arrays(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+            generator = LatinSquareGenerator(5,
+                                             subset='symbol_isotropy_classes',
+                                             in_place=True,
+                                             checkpoint_path=checkpoint_path,
+                                             checkpoint_interval=5)
+            output = []
+            for block in generator.get_latin_squares(as_arrays=True,
+                                                     chunk_size=10):
+                output.extend(block.tolist())
+                if len(output) >= 500:
+                    break
+            resumed_generator = LatinSquareGenerator.resume(
+                checkpoint_path, checkpoint_interval=5)
+            output = output[:resumed_generator.num_emitted]
+            for block in resumed_generator.get_latin_squares(as_arrays=True):
+                output.extend(block.tolist())
+            generator = LatinSquareGenerator(5,
+                                             subset='symbol_isotropy_classes')
+            self.assertCountEqual(output, list(generator.get_latin_squares()))
+
+    def test_resume_finished(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+            generator = LatinSquareGenerator(4,
+                                             subset='reduced',
+                                             checkpoint_path=checkpoint_path)
+            self.assertEqual(len(list(generator.get_latin_squares())), 4)
+            resumed_generator = LatinSquareGenerator.resume(checkpoint_path)
+            self.assertEqual(resumed_generator.num_emitted, 4)
+            self.assertListEqual(list(resumed_generator.get_latin_squares()),
+                                 [])
+
+    def test_resume_twice(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             in_place=True,
+                                             checkpoint_path=checkpoint_path,
+                                             checkpoint_interval=3)
+            output = []
+            for _ in range(2):
+                for latin_square in generator.get_latin_squares():
+                    output.append(latin_square)
+                    if len(output) % 20 == 0:
+                        break
+                generator = LatinSquareGenerator.resume(checkpoint_path,
+                                                        checkpoint_interval=3)
+                output = output[:generator.num_emitted]
+            output.extend(generator.get_latin_squares())
+            generator = LatinSquareGenerator(5, subset='reduced')
+            self.assertCountEqual(output, list(generator.get_latin_squares()))
+
+    def test_resume_with_callback_and_progress_reporter(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             checkpoint_path=checkpoint_path,
+                                             checkpoint_interval=10)
+            for num_emitted, _ in enumerate(generator.get_latin_squares(), 1):
+                if num_emitted == 25:
+                    break
+            calls = []
+            progress = []
+            generator = LatinSquareGenerator.resume(
+                checkpoint_path,
+                checkpoint_interval=10,
+                callback=lambda statistics: calls.append(
+                    statistics.terminal_nodes),
+                callback_interval=10,
+                progress_reporter=ProgressReporter(progress.append, 0))
+            num_remaining = 56 - generator.num_emitted
+            self.assertEqual(len(list(generator.get_latin_squares())),
+                             num_remaining)
+            self.assertEqual(calls[-1], num_remaining)
+            self.assertEqual(progress[-1].fraction_done, 1)
+
+    def test_checkpoint_in_parallel(self):
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          processes=2,
+                          checkpoint_path='checkpoint')
+
+    def test_statistics(self):
+        for in_place in (False, True):
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             in_place=in_place,
+                                             collect_statistics=True)
+            self.assertEqual(len(list(generator.get_latin_squares())), 56)
+            statistics = generator.statistics
+            self.assertEqual(statistics.terminal_nodes, 56)
+            self.assertEqual(statistics.nodes_per_depth[0], 1)
+            self.assertEqual(
+                sum(statistics.children_per_depth),
+                statistics.nodes_expanded + statistics.terminal_nodes - 1)
+            self.assertGreater(statistics.forced_placements, 0)
+
+    def test_statistics_not_collected_by_default(self):
+        for in_place in (False, True):
+            generator = LatinSquareGenerator(5,
+                                             subset='reduced',
+                                             in_place=in_place)
+            self.assertEqual(generator.count(), 56)
+            self.assertEqual(generator.statistics.terminal_nodes, 56)
+            self.assertEqual(generator.statistics.nodes_per_depth, [])
+
+    def test_statistics_in_parallel(self):
+        generator = LatinSquareGenerator(5,
+                                         subset='reduced',
+                                         collect_statistics=True)
+        generator.count()
+        parallel_generator = LatinSquareGenerator(5,
+                                                  subset='reduced',
+                                                  processes=2,
+                                                  collect_statistics=True)
+        parallel_generator.count()
+        self.assertEqual(parallel_generator.statistics.terminal_nodes, 56)
+        self.assertGreater(parallel_generator.statistics.nodes_expanded, 0)
+        self.assertListEqual(parallel_generator.statistics.nodes_per_depth,
+                             generator.statistics.nodes_per_depth)
+
+    def test_callback(self):
+        calls = []
+        generator = LatinSquareGenerator(
+            5,
+            subset='reduced',
+            callback=lambda statistics: calls.append(statistics.terminal_nodes),
+            callback_interval=20)
+        generator.count()
+        self.assertListEqual(calls, [20, 40, 56])
+
+    def test_callback_dlx(self):
+        for get_results, expected in (
+            (LatinSquareGenerator.count, [56]),
+            (lambda generator: list(generator.get_latin_squares()),
+             [20, 40, 56]),
+        ):
+            calls = []
+            generator = LatinSquareGenerator(
+                5,
+                subset='reduced',
+                engine='dlx',
+                callback=lambda statistics: calls.append(
+                    statistics.terminal_nodes),
+                callback_interval=20)
+            get_results(generator)
+            self.assertEqual(generator.statistics.terminal_nodes, 56)
+            self.assertEqual(generator.statistics.nodes_expanded, 0)
+            self.assertListEqual(calls, expected)
+
+    def test_callback_interval_divides_count(self):
+        for engine in ('set', 'bitmask', 'dlx'):
+            for in_place in (False, True):
+                calls = []
+                generator = LatinSquareGenerator(
+                    5,
+                    subset='reduced',
+                    engine=engine,
+                    in_place=in_place,
+                    callback=lambda statistics: calls.append(
+                        statistics.terminal_nodes),
+                    callback_interval=28)
+                self.assertEqual(len(list(generator.get_latin_squares())), 56)
+                self.assertListEqual(calls, [28, 56])
+
+    def test_progress_reporter(self):
+        for in_place in [False, True]:
+            progress = []
+            generator = LatinSquareGenerator(
+                5,
+                subset='reduced',
+                in_place=in_place,
+                progress_reporter=ProgressReporter(progress.append, 0))
+            generator.count()
+            fractions_done = [p.fraction_done for p in progress]
+            self.assertListEqual(fractions_done, sorted(fractions_done))
+            self.assertGreater(fractions_done[0], 0)
+            self.assertEqual(fractions_done[-1], 1)
+            self.assertEqual(progress[-1].terminal_nodes, 56)
+
+    def test_progress_reporter_in_parallel(self):
+        progress = []
+        generator = LatinSquareGenerator(
+            5,
+            subset='reduced',
+            processes=2,
+            progress_reporter=ProgressReporter(progress.append, 0))
+        self.assertEqual(len(list(generator.get_latin_squares())), 56)
+        self.assertEqual(progress[-1].fraction_done, 1)
+        for get_results in (LatinSquareGenerator.count,
+                            lambda generator: list(generator.get_latin_squares())):
+            progress = []
+            generator = LatinSquareGenerator(
+                5,
+                subset='reduced',
+                processes=2,
+                progress_reporter=ProgressReporter(progress.append, 3600))
+            get_results(generator)
+            self.assertEqual(len(progress), 1)
+            self.assertEqual(progress[-1].fraction_done, 1)
+            self.assertEqual(progress[-1].terminal_nodes, 56)
+
+    def test_progress_reporter_empty_shard(self):
+        progress = []
+        generator = LatinSquareGenerator(
+            3,
+            subset='reduced',
+            shard_index=5,
+            shard_count=8,
+            progress_reporter=ProgressReporter(progress.append, 0))
+        self.assertEqual(generator.count(), 0)
+        self.assertEqual(progress[-1].fraction_done, 1)
+
+    def test_estimate_tree_size(self):
+        generator = LatinSquareGenerator(5, subset='reduced')
+        estimate = generator.estimate_tree_size(num_probes=500, seed=0)
+        self.assertAlmostEqual(estimate.terminal_nodes, 56, delta=15)
+        self.assertEqual(len(list(generator.get_latin_squares())), 56)
+
+    def test_count_classes(self):
+        expected = {
+            'isotopy_classes': [1, 1, 1, 2, 2, 22],
+            'main_classes': [1, 1, 1, 2, 2, 12],
+        }
+        for subset, counts in expected.items():
+            for n, count in enumerate(counts, start=1):
+                generator = LatinSquareGenerator(n, subset=subset)
+                self.assertEqual(generator.count(), count)
+
+    def test_get_isotopy_classes(self):
+        generator = LatinSquareGenerator(4, subset='isotopy_classes')
+        actual = list(generator.get_latin_squares())
+        expected = [
+            [[0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 0, 1],
+            [3, 2, 1, 0]],
+
+            [[0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 1, 0],
+            [3, 2, 0, 1]],
+        ]
+        self.assertListEqual(actual, expected)
+        self.assertEqual(generator.num_emitted, 2)
+
+    def test_get_main_classes(self):
+        generator = LatinSquareGenerator(6, subset='main_classes')
+        isotopy_classes = list(
+            LatinSquareGenerator(6,
+                                 subset='isotopy_classes').get_latin_squares())
+        for latin_square in generator.get_latin_squares():
+            self.assertIn(latin_square, isotopy_classes)
+
+    def test_classes_in_parallel(self):
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          subset='isotopy_classes',
+                          processes=2)
+
+    def test_get_latin_squares_with_hashes(self):
+        for subset in ('reduced', 'symbol_isotropy_classes',
+                       'isotopy_classes'):
+            for kwargs in ({}, {'in_place': True}, {'engine': 'bitmask'},
+                           {'engine': 'dlx'}, {'processes': 2}):
+                if subset == 'isotopy_classes' and kwargs:
+                    continue
+                generator = LatinSquareGenerator(4, subset=subset, **kwargs)
+                records = list(generator.get_latin_squares(with_hashes=True))
+                expected = list(
+                    LatinSquareGenerator(4, subset=subset,
+                                         **kwargs).get_latin_squares())
+                self.assertListEqual([record[1] for record in records],
+                                     expected)
+                for hash_val, latin_square in records:
+                    self.assertEqual(hash_val, hash_latin_square(latin_square))
+
+    def test_hashes_skipped_unless_requested(self):
+        for kwargs in ({'engine': 'dlx'}, {'processes': 2}):
+            generator = LatinSquareGenerator(4, subset='reduced', **kwargs)
+            records = list(
+                generator._get_reduced_latin_squares_with_hashes(
+                    with_hashes=False))
+            self.assertEqual(len(records), 4)
+            self.assertTrue(all(hash_val is None for hash_val, _ in records))
+
+    def test_get_hashes(self):
+        generator = LatinSquareGenerator(5, subset='reduced', in_place=True)
+        expected = [
+            hash_latin_square(latin_square) for latin_square in
+            LatinSquareGenerator(5, subset='reduced').get_latin_squares()
+        ]
+        self.assertCountEqual(list(generator.get_hashes()), expected)
+        self.assertEqual(generator.num_emitted, 56)
+
+    def test_dlx_in_parallel(self):
+        self.assertRaises(ValueError,
+                          LatinSquareGenerator,
+                          4,
+                          engine='dlx',
+                          processes=2)
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError, LatinSquareGenerator, 4, engine='foo')
+
     def test_get_symbol_isotropy_classes(self):
         generator = LatinSquareGenerator(3, subset='symbol_isotropy_classes')
         actual = list(generator.get_latin_squares())
@@ -0,0 +1,57 @@
+from typing import Iterator, Optional
+
+from canonical_form import is_isotopy_canonical, is_main_class_canonical
+
+
+class LatinSquareOrderlySearch:
+
+    def __init__(self, n: int, main_classes: bool = False) -> None:
+        self._n = n
+        self._main_classes = main_classes
+
+    def get_latin_squares(self) -> Iterator[list[list[int]]]:
+        n = self._n
+        rows = [list(range(n))]
+        column_masks = [1 << s for s in range(n)]
+        yield from self._extend(rows, column_masks)
+
+    def count(self) -> int:
+        return sum(1 for _ in self.get_latin_squares())
+
+    def _extend(self, rows: list[list[int]],
+                column_masks: list[int]) -> Iterator[list[list[int]]]:
+        if len(rows) == self._n:
+            if not self._main_classes or is_main_class_canonical(rows):
+                yield [list(row) for row in rows]
+            return
+        lower_bound = rows[-1] if len(rows) >= 3 else None
+        for row in self._get_rows(column_masks, lower_bound):
+            rows.append(row)
+            if is_isotopy_canonical(rows):
+                for c, s in enumerate(row):
+                    column_masks[c] |= 1 << s
+                yield from self._extend(rows, column_masks)
+                for c, s in enumerate(row):
+                    column_masks[c] &= ~(1 << s)
+            rows.pop()
+
+    def _get_rows(self, column_masks: list[int],
+                  lower_bound: Optional[list[int]]) -> Iterator[list[int]]:
+        n = self._n
+        row = [0] * n
+
+        def fill(c: int, used: int, tight: bool) -> Iterator[list[int]]:
+            if c == n:
+                yield list(row)
+                return
+            start = lower_bound[c] if tight and lower_bound is not None else 0
+            available = column_masks[c] | used
+            for s in range(start, n):
+                if available >> s & 1:
+                    continue
+                row[c] = s
+                yield from fill(c + 1, used | 1 << s,
+                                tight and lower_bound is not None and
+                                s == lower_bound[c])
+
+        yield from fill(0, 0, True)
@@ -1,12 +1,84 @@
-from collections import defaultdict
-from copy import deepcopy
-from typing import Callable, DefaultDict, Union
+from copy import copy
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional, Union
+
+from search_statistics import SearchStatistics
+
+
+@lru_cache(maxsize=None)
+def _get_hash_powers(n: int) -> list[list[int]]:
+    return [[n**(n * n - 1 - (r * n + c)) for c in range(n)] for r in range(n)]
+
+
+class _Branch:
+
+    __slots__ = ('r', 'c', 'candidates', 'index', 'mark', 'weight')
+
+    def __init__(self, r: int, c: int, candidates: list[int], mark: int,
+                 weight: float) -> None:
+        self.r = r
+        self.c = c
+        self.candidates = candidates
+        self.index = 0
+        self.mark = mark
+        self.weight = weight
 
 
 class LatinSquareSearchNode:
 
-    def __init__(self, n: int, cell_container: type = set) -> None:
+    def __init__(self,
+                 n: int,
+                 cell_container: type = set,
+                 in_place: bool = False,
+                 hidden_singles: bool = False,
+                 reduced: bool = True) -> None:
         self._n = n
+        self._in_place = in_place
+        self._reduced = reduced
+        self._trail: list[tuple[int, int, int, Any]] = []
+        self._branches: list[_Branch] = []
+        self._depth = 0
+        self._weight = 1.0
+        self._init_symbols(cell_container)
+        self._init_hash_val()
+        self._init_liberties()
+        self._init_counts(hidden_singles)
+        self._update_symbols()
+        self._trail.clear()
+
+    @classmethod
+    def from_partial_latin_square(
+            cls, partial_latin_square: list[list[Optional[int]]],
+            **kwargs: Any) -> 'LatinSquareSearchNode':
+        n = len(partial_latin_square)
+        if any(len(row) != n for row in partial_latin_square):
+            raise ValueError
+        search_node = cls(n, reduced=False, **kwargs)
+        for r, row in enumerate(partial_latin_square):
+            for c, s in enumerate(row):
+                if s is None:
+                    continue
+                if not 0 <= s < n:
+                    raise ValueError
+                if not search_node._is_open(r, c):
+                    if search_node._symbols[r][c] == s:
+                        continue
+                    raise ValueError
+                if not search_node._has_symbol(r, c, s):
+                    raise ValueError
+                search_node._set_symbol(r, c, s)
+        search_node._update_symbols()
+        search_node._trail.clear()
+        return search_node
+
+    def _init_symbols(self, cell_container: type) -> None:
+        n = self._n
+        if not self._reduced:
+            self._symbols = [[cell_container(range(n))
+                              for _ in range(n)]
+                             for _ in range(n)]  # type: ignore
+            return
         get_new_cell: Callable[[int, int],
                                set[int]] = lambda r, c: cell_container(
                                    [s for s in range(n) if s != r and s != c])
@@ -18,63 +90,314 @@ class LatinSquareSearchNode:
                                        set[int]]]] = [[i for i in range(n)]]
         self._symbols.extend([get_new_row(r) for r in range(1, n)
                              ])  # type: ignore
-        self._liberties: DefaultDict[int, set[tuple[int,
-                                                    int]]] = defaultdict(set)
-        self._liberties[n - 2] = set([
-            (r, c) for c in range(1, n) for r in range(1, n)
-        ])
-        for i in range(1, n):
-            self._liberties[n - 2].remove((i, i))
-            self._liberties[n - 1].add((i, i))
+
+    def _init_hash_val(self) -> None:
+        hash_powers = _get_hash_powers(self._n)
+        self._hash_val = sum(
+            self._symbols[r][c] * hash_powers[r][c]  # type: ignore
+            for r in range(self._n) for c in range(self._n)
+            if not self._is_open(r, c))
+
+    def _init_liberties(self) -> None:
+        self._liberties: list[set[tuple[int, int]]] = [
+            set() for _ in range(self._n + 1)
+        ]
+        for r in range(self._n):
+            for c in range(self._n):
+                if self._is_open(r, c):
+                    self._liberties[self._get_domain_size(r, c)].add((r, c))
+        self._min_size = 0
+
+    def _init_counts(self, hidden_singles: bool) -> None:
+        self._hidden_singles: list[tuple[int, int, int]] = []
+        self._num_dead_units = 0
+        self._row_counts: Optional[list[list[int]]] = None
+        self._column_counts: Optional[list[list[int]]] = None
+        if not hidden_singles:
+            return
+        n = self._n
+        self._row_counts = [[0 for _ in range(n)] for _ in range(n)]
+        self._column_counts = [[0 for _ in range(n)] for _ in range(n)]
+        for r in range(n):
+            for c in range(n):
+                if self._is_open(r, c):
+                    symbols = self._get_domain(r, c)
+                else:
+                    symbols = [self._symbols[r][c]]  # type: ignore
+                for s in symbols:
+                    self._row_counts[r][s] += 1
+                    self._column_counts[c][s] += 1
+        for axis, counts in enumerate((self._row_counts, self._column_counts)):
+            for i in range(n):
+                for s in range(n):
+                    if counts[i][s] == 0:
+                        self._num_dead_units += 1
+                    elif counts[i][s] == 1:
+                        self._hidden_singles.append((axis, i, s))
 
     @property
     def symbols(self) -> list[list[Union[int, set[int]]]]:
         return self._symbols
 
+    def copy(self) -> 'LatinSquareSearchNode':
+        search_node = copy(self)
+        search_node._trail = []
+        search_node._branches = []
+        search_node._hidden_singles = []
+        # Rebuild rather than clone the sets so that their iteration order,
+        # and hence the branching cell, matches pickled copies in workers.
+        search_node._liberties = [
+            set(list(cells)) for cells in self._liberties
+        ]
+        if self._row_counts is not None:
+            search_node._row_counts = [
+                list(counts) for counts in self._row_counts
+            ]
+            search_node._column_counts = [
+                list(counts) for counts in self._column_counts  # type: ignore
+            ]
+        self._copy_symbols(search_node)
+        return search_node
+
+    def _copy_symbols(self, search_node: 'LatinSquareSearchNode') -> None:
+        search_node._symbols = [[copy(cell) for cell in row]
+                                for row in self._symbols]
+
+    def get_partial_latin_square(self) -> list[list[Optional[int]]]:
+        return [[
+            None if self._is_open(r, c) else self._symbols[r][c]
+            for c in range(self._n)
+        ] for r in range(self._n)]  # type: ignore
+
+    def _set_symbols(self,
+                     partial_latin_square: list[list[Optional[int]]]) -> None:
+        for r, row in enumerate(partial_latin_square):
+            for c, s in enumerate(row):
+                if s is not None and self._is_open(r, c):
+                    self._set_symbol(r, c, s)
+        self._update_symbols()
+        self._trail.clear()
+
+    def _get_unexplored_partial_latin_squares(
+            self) -> list[list[list[Optional[int]]]]:
+        if not self._branches:
+            return []
+        partial_latin_square = self.get_partial_latin_square()
+        for r, c, _, cell in self._trail[self._branches[0].mark:]:
+            if cell is not None:
+                partial_latin_square[r][c] = None
+        partial_latin_squares = []
+        for branch in self._branches:
+            for s in reversed(branch.candidates[branch.index + 1:]):
+                partial_latin_square[branch.r][branch.c] = s
+                partial_latin_squares.append(
+                    [list(row) for row in partial_latin_square])
+            partial_latin_square[branch.r][branch.c] = branch.candidates[
+                branch.index]
+        return partial_latin_squares
+
     def is_terminal(self) -> bool:
-        self._remove_empty_liberties()
-        return not self._liberties
+        return self._get_min_size() > self._n
 
-    def get_children(self):
-        self._remove_empty_liberties()
-        size = min(self._liberties.keys())
+    @property
+    def hash_val(self) -> int:
+        return self._hash_val
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def weight(self) -> float:
+        return self._weight
+
+    def _get_unexplored_weight(self) -> float:
+        return sum(branch.weight *
+                   (len(branch.candidates) - branch.index - 1) /
+                   len(branch.candidates) for branch in self._branches)
+
+    def get_children(self, statistics: Optional[SearchStatistics] = None):
+        size = self._get_min_size()
+        if self._in_place:
+            r, c = next(iter(self._liberties[size]))
+            yield from self._get_children_in_place(r, c, statistics)
+            return
         r, c = self._liberties[size].pop()
-        assert len(self._symbols[r][c]) == size  # type: ignore
-        for s in self._symbols[r][c]:  # type: ignore
-            child = deepcopy(self)
+        assert self._get_domain_size(r, c) == size
+        num_children = 0
+        num_forced = 0
+        if statistics is not None:
+            start = perf_counter()
+        for s in self._get_domain(r, c):
+            child = self.copy()
+            child._depth += 1
+            child._weight /= size
             child._set_symbol(r, c, s)  # type: ignore
-            child._update_symbols()
+            num_forced += child._update_symbols()
             if child._is_viable():
+                num_children += 1
                 yield child
+        if statistics is not None:
+            statistics.record_expansion(self._depth, size, num_children,
+                                        num_forced, perf_counter() - start)
+
+    def _get_children_in_place(self,
+                               r: int,
+                               c: int,
+                               statistics: Optional[SearchStatistics] = None):
+        mark = len(self._trail)
+        candidates = list(self._get_domain(r, c))
+        weight = self._weight
+        branch = _Branch(r, c, candidates, mark, weight)
+        self._branches.append(branch)
+        num_children = 0
+        num_forced = 0
+        seconds = 0.0
+        if statistics is not None:
+            start = perf_counter()
+        for index, s in enumerate(candidates):
+            branch.index = index
+            self._set_symbol(r, c, s)
+            num_forced += self._update_symbols()
+            if self._is_viable():
+                num_children += 1
+                self._depth += 1
+                self._weight = weight / len(candidates)
+                if statistics is not None:
+                    seconds += perf_counter() - start
+                yield self
+                if statistics is not None:
+                    start = perf_counter()
+                self._weight = weight
+                self._depth -= 1
+            self._undo(mark)
+        self._branches.pop()
+        if statistics is not None:
+            seconds += perf_counter() - start
+            statistics.record_expansion(self._depth, len(candidates),
+                                        num_children, num_forced, seconds)
+
+    def _undo(self, mark: int) -> None:
+        while len(self._trail) > mark:
+            r, c, s, cell = self._trail.pop()
+            if cell is None:
+                size = self._get_domain_size(r, c)
+                self._liberties[size].remove((r, c))
+                self._add_symbol(r, c, s)
+                self._liberties[size + 1].add((r, c))
+                if self._row_counts is not None:
+                    self._increment_counts(r, c, s)
+            else:
+                self._unplace_symbol(r, c, cell)
+                self._hash_val -= s * _get_hash_powers(self._n)[r][c]
+                size = self._get_domain_size(r, c)
+                self._liberties[size].add((r, c))
+                self._min_size = min(self._min_size, size)
+                if self._row_counts is not None:
+                    for t in self._get_domain(r, c):
+                        if t != s:
+                            self._increment_counts(r, c, t)
 
-    def _remove_empty_liberties(self) -> None:
-        for size in range(self._n):
-            if len(self._liberties[size]) == 0:
-                del self._liberties[size]
+    def _get_min_size(self) -> int:
+        while self._min_size <= self._n and not self._liberties[
+                self._min_size]:
+            self._min_size += 1
+        return self._min_size
 
-    def _update_symbols(self) -> None:
-        while self._liberties[1]:
-            r, c = self._liberties[1].pop()
-            assert len(self._symbols[r][c]) == 1  # type: ignore
-            s = self._symbols[r][c].pop()  # type: ignore
-            self._set_symbol(r, c, s)  # type: ignore
+    def _update_symbols(self) -> int:
+        num_forced = 0
+        while self._is_viable():
+            if self._liberties[1]:
+                r, c = next(iter(self._liberties[1]))
+                assert self._get_domain_size(r, c) == 1
+                s = next(iter(self._get_domain(r, c)))
+                self._set_symbol(r, c, s)
+            elif self._hidden_singles:
+                if not self._set_hidden_single(*self._hidden_singles.pop()):
+                    continue
+            else:
+                break
+            num_forced += 1
+        self._hidden_singles.clear()
+        return num_forced
+
+    def _set_hidden_single(self, axis: int, i: int, s: int) -> bool:
+        for j in range(self._n):
+            r, c = (i, j) if axis == 0 else (j, i)
+            if self._is_open(r, c) and self._has_symbol(r, c, s):
+                self._set_symbol(r, c, s)
+                return True
+        return False
 
     def _set_symbol(self, r: int, c: int, s: int) -> None:
-        size = len(self._symbols[r][c])  # type: ignore
+        size = self._get_domain_size(r, c)
         self._liberties[size].discard((r, c))
-        self._symbols[r][c] = s
+        if self._row_counts is not None:
+            for t in self._get_domain(r, c):
+                if t != s:
+                    self._decrement_counts(r, c, t)
+        cell = self._place_symbol(r, c, s)
+        self._hash_val += s * _get_hash_powers(self._n)[r][c]
+        if self._in_place:
+            self._trail.append((r, c, s, cell))
         for i in range(self._n):
             self._remove_symbol(r, i, s)
             self._remove_symbol(i, c, s)
 
     def _remove_symbol(self, r: int, c: int, s: int) -> None:
-        if hasattr(self._symbols[r][c], 'remove'):
-            if s in self._symbols[r][c]:  # type: ignore
-                size = len(self._symbols[r][c])  # type: ignore
-                self._liberties[size].remove((r, c))
-                self._symbols[r][c].remove(s)  # type: ignore
-                size = len(self._symbols[r][c])  # type: ignore
-                self._liberties[size].add((r, c))
+        cell = self._symbols[r][c]
+        if hasattr(cell, 'remove') and s in cell:  # type: ignore
+            size = len(cell)  # type: ignore
+            self._liberties[size].remove((r, c))
+            cell.remove(s)  # type: ignore
+            self._liberties[size - 1].add((r, c))
+            if size - 1 < self._min_size:
+                self._min_size = size - 1
+            if self._in_place:
+                self._trail.append((r, c, s, None))
+            if self._row_counts is not None:
+                self._decrement_counts(r, c, s)
+
+    def _decrement_counts(self, r: int, c: int, s: int) -> None:
+        for axis, i, counts in ((0, r, self._row_counts[r]),
+                                (1, c, self._column_counts[c])):  # type: ignore
+            counts[s] -= 1
+            if counts[s] == 1:
+                self._hidden_singles.append((axis, i, s))
+            elif counts[s] == 0:
+                self._num_dead_units += 1
+
+    def _increment_counts(self, r: int, c: int, s: int) -> None:
+        for counts in (self._row_counts[r],
+                       self._column_counts[c]):  # type: ignore
+            counts[s] += 1
+            if counts[s] == 1:
+                self._num_dead_units -= 1
 
     def _is_viable(self) -> bool:
-        return len(self._liberties[0]) == 0
+        return len(self._liberties[0]) == 0 and self._num_dead_units == 0
+
+    # ------- cell domain methods ----------------------------------------------
+
+    def _is_open(self, r: int, c: int) -> bool:
+        return hasattr(self._symbols[r][c], 'remove')
+
+    def _get_domain(self, r: int, c: int) -> Iterable[int]:
+        return self._symbols[r][c]  # type: ignore
+
+    def _get_domain_size(self, r: int, c: int) -> int:
+        return len(self._symbols[r][c])  # type: ignore
+
+    def _has_symbol(self, r: int, c: int, s: int) -> bool:
+        return s in self._symbols[r][c]  # type: ignore
+
+    def _add_symbol(self, r: int, c: int, s: int) -> None:
+        self._symbols[r][c].add(s)  # type: ignore
+
+    def _place_symbol(self, r: int, c: int, s: int) -> Any:
+        cell = self._symbols[r][c]
+        self._symbols[r][c] = s
+        return cell
+
+    def _unplace_symbol(self, r: int, c: int, cell: Any) -> None:
+        self._symbols[r][c] = cell
@@ -0,0 +1,72 @@
+import argparse
+import timeit
+from itertools import islice
+
+from latin_square_generator import LatinSquareGenerator, SEARCH_NODE_TYPES
+from latin_square_search_node import LatinSquareSearchNode
+
+
+def time_reduced_latin_squares(n, engine, in_place, hidden_singles, limit,
+                               repeat):
+    def run():
+        generator = LatinSquareGenerator(n,
+                                         subset='reduced',
+                                         engine=engine,
+                                         in_place=in_place,
+                                         hidden_singles=hidden_singles)
+        for _ in islice(generator.get_latin_squares(), limit):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def count_search_nodes(n, hidden_singles, limit):
+    num_nodes = 0
+    num_candidates = 0
+    num_squares = 0
+    search_nodes = [LatinSquareSearchNode(n, hidden_singles=hidden_singles)]
+    while search_nodes and num_squares < limit:
+        search_node = search_nodes.pop()
+        num_nodes += 1
+        if search_node.is_terminal():
+            num_squares += 1
+        else:
+            num_candidates += search_node._get_min_size()
+            search_nodes.extend(search_node.get_children())
+    return num_nodes, num_candidates, num_squares
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time reduced Latin square enumeration per engine.')
+    parser.add_argument('--orders', type=int, nargs='+', default=[5, 6, 7])
+    parser.add_argument('--limit', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(f'{"n":>2} {"engine":>8} {"in_place":>8} {"hidden":>6} '
+          f'{"seconds":>9}')
+    for n in args.orders:
+        for engine in SEARCH_NODE_TYPES:
+            for in_place in (False, True):
+                for hidden_singles in (False, True):
+                    seconds = time_reduced_latin_squares(
+                        n, engine, in_place, hidden_singles, args.limit,
+                        args.repeat)
+                    print(f'{n:>2} {engine:>8} {str(in_place):>8} '
+                          f'{str(hidden_singles):>6} {seconds:>9.3f}')
+        seconds = time_reduced_latin_squares(n, 'dlx', False, False,
+                                             args.limit, args.repeat)
+        print(f'{n:>2} {"dlx":>8} {"-":>8} {"-":>6} {seconds:>9.3f}')
+    print()
+    print(f'{"n":>2} {"hidden":>6} {"nodes":>9} {"candidates":>10} '
+          f'{"squares":>9}')
+    for n in args.orders:
+        for hidden_singles in (False, True):
+            num_nodes, num_candidates, num_squares = count_search_nodes(
+                n, hidden_singles, args.limit)
+            print(f'{n:>2} {str(hidden_singles):>6} {num_nodes:>9} '
+                  f'{num_candidates:>10} {num_squares:>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+import unittest
+from copy import deepcopy
+
+from latin_square_search_node import LatinSquareSearchNode
+from utils import hash_latin_square
+
+
+class LatinSquareSearchNodeTest(unittest.TestCase):
+
+    def test_liberties(self):
+        search_node = LatinSquareSearchNode(4)
+        self.assertEqual(len(search_node._liberties), 5)
+        self.assertEqual(search_node._liberties[2],
+                         {(1, 2), (1, 3), (2, 1), (2, 3), (3, 1), (3, 2)})
+        self.assertEqual(search_node._liberties[3], {(1, 1), (2, 2), (3, 3)})
+        self.assertEqual(search_node._get_min_size(), 2)
+        self.assertFalse(search_node.is_terminal())
+
+    def test_liberties_in_place(self):
+        search_node = LatinSquareSearchNode(5, in_place=True)
+        liberties = deepcopy(search_node._liberties)
+        for child_node in search_node.get_children():
+            for size, cells in enumerate(child_node._liberties):
+                for r, c in cells:
+                    self.assertEqual(len(child_node.symbols[r][c]), size)
+            self.assertGreaterEqual(child_node._get_min_size(), 2)
+        self.assertEqual(search_node._liberties, liberties)
+        self.assertEqual(search_node._get_min_size(), 3)
+
+    def test_is_terminal(self):
+        search_node = LatinSquareSearchNode(4)
+        self.assertFalse(search_node.is_terminal())
+        search_node = LatinSquareSearchNode(2)
+        self.assertTrue(search_node.is_terminal())
+
+    def test_small_orders_are_solved_on_init(self):
+        for n in range(1, 4):
+            search_node = LatinSquareSearchNode(n)
+            self.assertTrue(search_node.is_terminal())
+        self.assertEqual(LatinSquareSearchNode(3).symbols,
+                         [[0, 1, 2], [1, 2, 0], [2, 0, 1]])
+
+    def test_counts(self):
+        search_node = LatinSquareSearchNode(4, hidden_singles=True)
+        self.assertEqual(search_node._row_counts[1], [3, 1, 2, 2])
+        self.assertEqual(search_node._column_counts[2], [3, 2, 1, 2])
+        self.assertEqual(search_node._num_dead_units, 0)
+        self.assertIsNone(LatinSquareSearchNode(4)._row_counts)
+
+    def test_set_hidden_single(self):
+        for hidden_singles in (False, True):
+            search_node = LatinSquareSearchNode(5,
+                                                hidden_singles=hidden_singles)
+            search_node._set_symbol(1, 1, 3)
+            search_node._set_symbol(3, 3, 2)
+            search_node._update_symbols()
+            if hidden_singles:
+                self.assertEqual(search_node.symbols[1],
+                                 [1, 3, {0, 4}, {0, 4}, 2])
+                self.assertEqual(search_node._row_counts[1], [2, 1, 1, 1, 2])
+            else:
+                self.assertEqual(search_node.symbols[1][4], {0, 2})
+
+    def test_dead_unit(self):
+        search_node = LatinSquareSearchNode(5, hidden_singles=True)
+        search_node._set_symbol(3, 1, 4)
+        search_node._set_symbol(1, 3, 4)
+        search_node._set_symbol(2, 2, 3)
+        self.assertEqual(search_node._liberties[0], set())
+        self.assertGreater(search_node._num_dead_units, 0)
+        self.assertFalse(search_node._is_viable())
+
+    def test_hidden_singles_in_place_restores_counts(self):
+        search_node = LatinSquareSearchNode(5,
+                                            in_place=True,
+                                            hidden_singles=True)
+        row_counts = deepcopy(search_node._row_counts)
+        column_counts = deepcopy(search_node._column_counts)
+        for child_node in search_node.get_children():
+            for child_node in child_node.get_children():
+                self.assertEqual(child_node._num_dead_units, 0)
+        self.assertEqual(search_node._row_counts, row_counts)
+        self.assertEqual(search_node._column_counts, column_counts)
+        self.assertEqual(search_node._num_dead_units, 0)
+
+    def test_hidden_singles_prune_search(self):
+        def count_search_nodes(search_node):
+            num_nodes = 0
+            search_nodes = [search_node]
+            while search_nodes:
+                search_node = search_nodes.pop()
+                num_nodes += 1
+                if not search_node.is_terminal():
+                    search_nodes.extend(search_node.get_children())
+            return num_nodes
+
+        self.assertLess(
+            count_search_nodes(LatinSquareSearchNode(5,
+                                                     hidden_singles=True)),
+            count_search_nodes(LatinSquareSearchNode(5)))
+
+    def test_get_children_in_place_restores_node(self):
+        search_node = LatinSquareSearchNode(5, in_place=True)
+        symbols = deepcopy(search_node.symbols)
+        for child_node in search_node.get_children():
+            self.assertIs(child_node, search_node)
+            self.assertNotEqual(child_node.symbols, symbols)
+        self.assertEqual(search_node.symbols, symbols)
+        self.assertEqual(search_node._trail, [])
+
+    def test_hash_val(self):
+        search_node = LatinSquareSearchNode(3)
+        self.assertEqual(search_node.hash_val, 4069)
+        search_node = LatinSquareSearchNode(4)
+        partial_hash_val = hash_latin_square(
+            [[0 if s is None else s for s in row]
+             for row in search_node.get_partial_latin_square()])
+        self.assertEqual(search_node.hash_val, partial_hash_val)
+        for in_place in (False, True):
+            search_nodes = [LatinSquareSearchNode(5, in_place=in_place)]
+            while search_nodes:
+                search_node = search_nodes.pop()
+                if search_node.is_terminal():
+                    self.assertEqual(search_node.hash_val,
+                                     hash_latin_square(search_node.symbols))
+                elif in_place:
+                    for child_node in search_node.get_children():
+                        search_nodes.append(child_node.copy())
+                else:
+                    search_nodes.extend(search_node.get_children())
+
+    def test_hash_val_restored_in_place(self):
+        search_node = LatinSquareSearchNode(5, in_place=True)
+        hash_val = search_node.hash_val
+        child_hash_vals = [
+            child_node.hash_val for child_node in search_node.get_children()
+        ]
+        self.assertEqual(len(set(child_hash_vals)), len(child_hash_vals))
+        self.assertEqual(search_node.hash_val, hash_val)
+
+    def test_get_partial_latin_square(self):
+        search_node = LatinSquareSearchNode(4)
+        self.assertEqual(search_node.get_partial_latin_square(), [
+            [0, 1, 2, 3],
+            [1, None, None, None],
+            [2, None, None, None],
+            [3, None, None, None],
+        ])
+
+    def test_set_symbols(self):
+        search_node = LatinSquareSearchNode(4)
+        search_node._set_symbols([
+            [None, None, None, None],
+            [None, 0, None, None],
+            [None, None, None, None],
+            [None, None, None, 0],
+        ])
+        self.assertEqual(search_node.symbols, [
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 0, 1],
+            [3, 2, 1, 0],
+        ])
+        self.assertEqual(search_node._trail, [])
+
+    def test_from_partial_latin_square(self):
+        search_node = LatinSquareSearchNode.from_partial_latin_square([
+            [None, 1, None],
+            [None, None, None],
+            [2, None, None],
+        ])
+        self.assertTrue(search_node.is_terminal())
+        self.assertEqual(search_node.get_partial_latin_square(), [
+            [0, 1, 2],
+            [1, 2, 0],
+            [2, 0, 1],
+        ])
+
+    def test_from_partial_latin_square_order_one(self):
+        search_node = LatinSquareSearchNode.from_partial_latin_square([[0]])
+        self.assertTrue(search_node.is_terminal())
+        self.assertEqual(search_node.get_partial_latin_square(), [[0]])
+
+    def test_from_partial_latin_square_open(self):
+        search_node = LatinSquareSearchNode.from_partial_latin_square(
+            [[None] * 4 for _ in range(4)])
+        self.assertEqual(search_node._liberties[4],
+                         {(r, c) for r in range(4) for c in range(4)})
+        self.assertEqual(search_node._trail, [])
+
+    def test_from_partial_latin_square_conflict(self):
+        for partial_latin_square in [
+            [[0, 0], [None, None]],
+            [[0, None], [0, None]],
+            [[2, None], [None, None]],
+            [[0, None], [None]],
+        ]:
+            self.assertRaises(ValueError,
+                              LatinSquareSearchNode.from_partial_latin_square,
+                              partial_latin_square)
+
+    def test_get_unexplored_partial_latin_squares(self):
+        search_node = LatinSquareSearchNode(5, in_place=True)
+        self.assertEqual(search_node._get_unexplored_partial_latin_squares(),
+                         [])
+        expected = [
+            child_node.get_partial_latin_square()
+            for child_node in LatinSquareSearchNode(5).get_children()
+        ]
+        for i, child_node in enumerate(search_node.get_children()):
+            actual = child_node._get_unexplored_partial_latin_squares()
+            self.assertEqual(len(actual), len(expected) - i - 1)
+            for partial_latin_square in actual:
+                restored_node = LatinSquareSearchNode(5)
+                restored_node._set_symbols(partial_latin_square)
+                self.assertIn(restored_node.get_partial_latin_square(),
+                              expected[i + 1:])
+
+    def test_get_children_in_place_matches_copies(self):
+        search_node = LatinSquareSearchNode(5)
+        in_place_search_node = LatinSquareSearchNode(5, in_place=True)
+        expected = [
+            deepcopy(child_node.symbols)
+            for child_node in search_node.get_children()
+        ]
+        actual = [
+            deepcopy(child_node.symbols)
+            for child_node in in_place_search_node.get_children()
+        ]
+        self.assertCountEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
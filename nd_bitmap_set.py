@@ -7,9 +7,14 @@ from bitmap_set import BitmapSet, Bounds, Elem, Elems
 
 class NdBitmapSet(BitmapSet):
 
-    def __init__(self, bounds: Bounds, elems: Optional[Elems] = None) -> None:
+    __slots__ = ('_shape',)
+
+    def __init__(self,
+                 bounds: Bounds,
+                 elems: Optional[Elems] = None,
+                 validate: bool = True) -> None:
         self._shape = bounds
-        super().__init__(bounds, elems)
+        super().__init__(bounds, elems, validate)
 
     @classmethod
     def _validate_bounds(cls, bounds: Bounds) -> None:
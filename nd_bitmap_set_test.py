@@ -175,6 +175,15 @@ class NdBitmapSetTest(unittest.TestCase):
         bitmap_set.discard(_d)
         self.assertListEqual(list(bitmap_set), [_a, _b])
 
+    def test_unvalidated(self):
+        bitmap_set = NdBitmapSet(_shape, elems=[_a, _b, _c], validate=False)
+        bitmap_set.add(_d)
+        bitmap_set.discard(_a)
+        self.assertTrue(_d in bitmap_set)
+        self.assertListEqual(list(bitmap_set), [_b, _c, _d])
+        self.assertListEqual(list(reversed(bitmap_set)), [_d, _c, _b])
+        self.assertFalse(bitmap_set.copy().validate)
+
     def test_pop(self):
         bitmap_set = NdBitmapSet(_shape, elems=[_a, _b, _c])
         elem = bitmap_set.pop()
@@ -8,5 +8,38 @@ csr = lambda triple: Triple(r=triple.c, c=triple.s, s=triple.r)
 src = lambda triple: Triple(r=triple.s, c=triple.r, s=triple.c)
 scr = lambda triple: Triple(r=triple.s, c=triple.c, s=triple.r)
 
+CONJUGATE_COLUMNS = {
+    'rcs': (0, 1, 2),
+    'rsc': (0, 2, 1),
+    'crs': (1, 0, 2),
+    'csr': (1, 2, 0),
+    'src': (2, 0, 1),
+    'scr': (2, 1, 0),
+}
+
+CONJUGATE_NAMES = list(CONJUGATE_COLUMNS)
+
+_CONJUGATE_NAMES_BY_COLUMNS = {
+    columns: name for name, columns in CONJUGATE_COLUMNS.items()
+}
+
+CONJUGATE_COMPOSITION = {
+    (first, second): _CONJUGATE_NAMES_BY_COLUMNS[tuple(
+        CONJUGATE_COLUMNS[first][i] for i in CONJUGATE_COLUMNS[second])]
+    for first in CONJUGATE_NAMES for second in CONJUGATE_NAMES
+}
+
+CONJUGATE_INVERSES = {
+    name: next(other for other in CONJUGATE_NAMES
+               if CONJUGATE_COMPOSITION[name, other] == 'rcs')
+    for name in CONJUGATE_NAMES
+}
+
+def compose_conjugates(*names):
+    composed = 'rcs'
+    for name in names:
+        composed = CONJUGATE_COMPOSITION[composed, name]
+    return composed
+
 def permute_orthogonal_array_triple(orthogonal_array, permutation):
     return [permutation(triple) for triple in orthogonal_array]
\ No newline at end of file
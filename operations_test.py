@@ -1,7 +1,7 @@
 import unittest
 
 from operations import *
-from utils import Triple
+from utils import Triple, from_orthogonal_array, to_orthogonal_array
 
 
 class OperationsTest(unittest.TestCase):
@@ -142,6 +142,44 @@ class OperationsTest(unittest.TestCase):
         ]
         self.assertCountEqual(actual, expected)
 
+    def test_conjugate_composition(self):
+        conjugates = {
+            'rcs': rcs,
+            'rsc': rsc,
+            'crs': crs,
+            'csr': csr,
+            'src': src,
+            'scr': scr,
+        }
+        orthogonal_array = to_orthogonal_array([
+            [0, 2, 1, 3],
+            [1, 3, 0, 2],
+            [2, 0, 3, 1],
+            [3, 1, 2, 0],
+        ])
+        for first in CONJUGATE_NAMES:
+            for second in CONJUGATE_NAMES:
+                actual = permute_orthogonal_array_triple(
+                    permute_orthogonal_array_triple(orthogonal_array,
+                                                    conjugates[first]),
+                    conjugates[second])
+                expected = permute_orthogonal_array_triple(
+                    orthogonal_array,
+                    conjugates[CONJUGATE_COMPOSITION[first, second]])
+                self.assertListEqual(from_orthogonal_array(actual),
+                                     from_orthogonal_array(expected))
+
+    def test_conjugate_inverses(self):
+        for name in CONJUGATE_NAMES:
+            self.assertEqual(
+                CONJUGATE_COMPOSITION[name, CONJUGATE_INVERSES[name]], 'rcs')
+        self.assertEqual(CONJUGATE_INVERSES['csr'], 'src')
+
+    def test_compose_conjugates(self):
+        self.assertEqual(compose_conjugates(), 'rcs')
+        self.assertEqual(compose_conjugates('rsc', 'crs'), 'src')
+        self.assertEqual(compose_conjugates('csr', 'csr', 'csr'), 'rcs')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+from multiprocessing import Pool
+from typing import Iterable, Iterator, Optional, Sequence
+
+from dancing_links import DancingLinks
+
+Rows = Sequence[Sequence[int]]
+
+
+def get_transversals(latin_square: Rows) -> list[tuple[int, ...]]:
+    n = len(latin_square)
+    cells = [[(c, 1 << c, 1 << s) for c, s in enumerate(row)]
+             for row in latin_square]
+    transversals: list[tuple[int, ...]] = []
+    columns = [0] * n
+
+    def extend(r: int, used_columns: int, used_symbols: int) -> None:
+        if r == n:
+            transversals.append(tuple(columns))
+            return
+        for c, column_bit, symbol_bit in cells[r]:
+            if used_columns & column_bit or used_symbols & symbol_bit:
+                continue
+            columns[r] = c
+            extend(r + 1, used_columns | column_bit, used_symbols | symbol_bit)
+
+    extend(0, 0, 0)
+    return transversals
+
+
+def count_transversals(latin_square: Rows) -> int:
+    n = len(latin_square)
+    states = {0: 1}
+    for row in latin_square:
+        cells = [(1 << c | 1 << (n + s)) for c, s in enumerate(row)]
+        next_states: dict[int, int] = {}
+        for state, count in states.items():
+            for cell in cells:
+                if state & cell:
+                    continue
+                next_state = state | cell
+                next_states[next_state] = next_states.get(next_state, 0) + count
+        states = next_states
+    return sum(states.values())
+
+
+def count_transversals_in_batch(latin_squares: Iterable[Rows],
+                                processes: Optional[int] = None,
+                                chunksize: int = 64) -> Iterator[int]:
+    if processes is None:
+        yield from map(count_transversals, latin_squares)
+        return
+    with Pool(processes) as pool:
+        yield from pool.imap(count_transversals, latin_squares, chunksize)
+
+
+def get_orthogonal_mates(latin_square: Rows,
+                         limit: Optional[int] = None
+                        ) -> Iterator[list[list[int]]]:
+    if limit is not None and limit <= 0:
+        return
+    n = len(latin_square)
+    transversals = get_transversals(latin_square)
+    dancing_links = DancingLinks(n * n, [[r * n + c
+                                          for r, c in enumerate(transversal)]
+                                         for transversal in transversals])
+    num_mates = 0
+    for solution in dancing_links.get_solutions():
+        mate = [[0] * n for _ in range(n)]
+        for row_id in solution:
+            transversal = transversals[row_id]
+            s = transversal[0]
+            for r, c in enumerate(transversal):
+                mate[r][c] = s
+        yield mate
+        num_mates += 1
+        if num_mates == limit:
+            return
+
+
+def has_orthogonal_mate(latin_square: Rows) -> bool:
+    return any(True for _ in get_orthogonal_mates(latin_square, limit=1))
+
+
+def is_orthogonal(latin_square: Rows, other_latin_square: Rows) -> bool:
+    n = len(latin_square)
+    pairs = {(s, t)
+             for row, other_row in zip(latin_square, other_latin_square)
+             for s, t in zip(row, other_row)}
+    return len(pairs) == n * n
@@ -0,0 +1,89 @@
+import unittest
+
+from latin_square_generator import LatinSquareGenerator
+from orthogonal_mates import (count_transversals, count_transversals_in_batch,
+                              get_orthogonal_mates, get_transversals,
+                              has_orthogonal_mate, is_orthogonal)
+
+
+def get_cyclic_latin_square(n):
+    return [[(r + c) % n for c in range(n)] for r in range(n)]
+
+
+class OrthogonalMatesTest(unittest.TestCase):
+
+    def test_get_transversals(self):
+        latin_square = get_cyclic_latin_square(3)
+        self.assertListEqual(get_transversals(latin_square),
+                             [(0, 1, 2), (1, 2, 0), (2, 0, 1)])
+        expected = [1, 0, 3, 0, 15, 0, 133]
+        for n, num_transversals in enumerate(expected, start=1):
+            self.assertEqual(len(get_transversals(get_cyclic_latin_square(n))),
+                             num_transversals)
+
+    def test_transversals_are_transversals(self):
+        latin_square = [
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 0, 1],
+            [3, 2, 1, 0],
+        ]
+        transversals = get_transversals(latin_square)
+        self.assertEqual(len(transversals), 8)
+        for transversal in transversals:
+            self.assertSetEqual(set(transversal), set(range(4)))
+            self.assertSetEqual(
+                {latin_square[r][c] for r, c in enumerate(transversal)},
+                set(range(4)))
+
+    def test_count_transversals(self):
+        expected = [1, 0, 3, 0, 15, 0, 133, 0, 2025]
+        for n, num_transversals in enumerate(expected, start=1):
+            self.assertEqual(count_transversals(get_cyclic_latin_square(n)),
+                             num_transversals)
+
+    def test_count_transversals_in_batch(self):
+        latin_squares = list(
+            LatinSquareGenerator(5, subset='reduced').get_latin_squares())
+        expected = [
+            len(get_transversals(latin_square))
+            for latin_square in latin_squares
+        ]
+        self.assertListEqual(list(count_transversals_in_batch(latin_squares)),
+                             expected)
+        self.assertListEqual(
+            list(
+                count_transversals_in_batch(iter(latin_squares),
+                                            processes=2,
+                                            chunksize=8)), expected)
+
+    def test_get_orthogonal_mates(self):
+        latin_square = get_cyclic_latin_square(5)
+        mates = list(get_orthogonal_mates(latin_square))
+        self.assertEqual(len(mates), 3)
+        for mate in mates:
+            self.assertListEqual(mate[0], list(range(5)))
+            self.assertTrue(is_orthogonal(latin_square, mate))
+        self.assertEqual(
+            len(list(get_orthogonal_mates(latin_square, limit=2))), 2)
+
+    def test_has_orthogonal_mate(self):
+        self.assertTrue(has_orthogonal_mate(get_cyclic_latin_square(3)))
+        self.assertFalse(has_orthogonal_mate(get_cyclic_latin_square(4)))
+        self.assertFalse(has_orthogonal_mate(get_cyclic_latin_square(6)))
+        self.assertTrue(has_orthogonal_mate([
+            [0, 1, 2, 3],
+            [1, 0, 3, 2],
+            [2, 3, 0, 1],
+            [3, 2, 1, 0],
+        ]))
+
+    def test_is_orthogonal(self):
+        latin_square = get_cyclic_latin_square(3)
+        self.assertFalse(is_orthogonal(latin_square, latin_square))
+        self.assertTrue(
+            is_orthogonal(latin_square, [[0, 1, 2], [2, 0, 1], [1, 2, 0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
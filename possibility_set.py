@@ -8,9 +8,14 @@ from nd_bitmap_set import NdBitmapSet
 
 class PossibilitySet(NdBitmapSet):
 
-    def __init__(self, bounds, elems: Optional[Elems] = None) -> None:
+    __slots__ = ('_masks',)
+
+    def __init__(self,
+                 bounds,
+                 elems: Optional[Elems] = None,
+                 validate: bool = True) -> None:
         elems = elems if elems else (1 << self._get_size(bounds)) - 1
-        super().__init__(bounds, elems)
+        super().__init__(bounds, elems, validate)
         self._init_masks()
 
     def elminate(self, elem: Elem) -> None:
@@ -0,0 +1,55 @@
+from collections import namedtuple
+from time import perf_counter
+from typing import Callable, Optional
+
+Progress = namedtuple('Progress', [
+    'fraction_done', 'elapsed_seconds', 'remaining_seconds', 'terminal_nodes',
+    'estimated_terminal_nodes'
+])
+
+
+def _print_progress(progress: Progress) -> None:
+    print(f'{100 * progress.fraction_done:6.2f}% done, '
+          f'{progress.elapsed_seconds:.0f}s elapsed, '
+          f'~{progress.remaining_seconds:.0f}s remaining, '
+          f'{progress.terminal_nodes} of '
+          f'~{progress.estimated_terminal_nodes:.0f} terminal nodes')
+
+
+class ProgressReporter:
+
+    def __init__(self,
+                 callback: Callable[[Progress], None] = _print_progress,
+                 interval_seconds: float = 10.0) -> None:
+        self._callback = callback
+        self._interval_seconds = interval_seconds
+        self._start: Optional[float] = None
+        self._last_report = 0.0
+        self.progress: Optional[Progress] = None
+
+    def start(self) -> None:
+        self._start = self._last_report = perf_counter()
+
+    def is_due(self) -> bool:
+        return perf_counter() - self._last_report >= self._interval_seconds
+
+    def report(self, fraction_done: float, terminal_nodes: int) -> Progress:
+        if self._start is None:
+            self.start()
+        now = perf_counter()
+        self._last_report = now
+        elapsed_seconds = now - self._start  # type: ignore
+        if fraction_done > 0:
+            remaining_seconds = elapsed_seconds * (1 -
+                                                   fraction_done) / fraction_done
+            estimated_terminal_nodes = terminal_nodes / fraction_done
+        else:
+            remaining_seconds = float('inf')
+            estimated_terminal_nodes = float('inf')
+        self.progress = Progress(fraction_done=fraction_done,
+                                 elapsed_seconds=elapsed_seconds,
+                                 remaining_seconds=remaining_seconds,
+                                 terminal_nodes=terminal_nodes,
+                                 estimated_terminal_nodes=estimated_terminal_nodes)
+        self._callback(self.progress)
+        return self.progress
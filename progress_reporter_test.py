@@ -0,0 +1,33 @@
+import unittest
+
+from progress_reporter import ProgressReporter
+
+
+class ProgressReporterTest(unittest.TestCase):
+
+    def test_report(self):
+        progress = []
+        reporter = ProgressReporter(progress.append, 0)
+        reporter.start()
+        reporter.report(0.25, 10)
+        self.assertEqual(len(progress), 1)
+        self.assertEqual(progress[0].fraction_done, 0.25)
+        self.assertEqual(progress[0].estimated_terminal_nodes, 40)
+        self.assertAlmostEqual(progress[0].remaining_seconds,
+                               3 * progress[0].elapsed_seconds)
+        self.assertIs(reporter.progress, progress[0])
+
+    def test_report_nothing_done(self):
+        reporter = ProgressReporter(lambda progress: None, 0)
+        progress = reporter.report(0.0, 0)
+        self.assertEqual(progress.remaining_seconds, float('inf'))
+
+    def test_is_due(self):
+        reporter = ProgressReporter(lambda progress: None, 3600)
+        reporter.start()
+        self.assertFalse(reporter.is_due())
+        self.assertTrue(ProgressReporter(lambda progress: None, 0).is_due())
+
+
+if __name__ == '__main__':
+    unittest.main()
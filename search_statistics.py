@@ -0,0 +1,91 @@
+from typing import Any
+
+
+class SearchStatistics:
+    """Counters collected while enumerating Latin squares.
+
+    The search-node engines fill every field. The dlx engine only counts
+    terminal_nodes. Its per-depth lists stay empty, so nodes_expanded,
+    forced_placements and dead_ends are reported as zero.
+    """
+
+    def __init__(self) -> None:
+        self.nodes_per_depth: list[int] = []
+        self.candidates_per_depth: list[int] = []
+        self.children_per_depth: list[int] = []
+        self.forced_per_depth: list[int] = []
+        self.seconds_per_depth: list[float] = []
+        self.terminal_nodes = 0
+
+    def record_expansion(self, depth: int, num_candidates: int,
+                         num_children: int, num_forced: int,
+                         seconds: float) -> None:
+        self._extend(depth + 1)
+        self.nodes_per_depth[depth] += 1
+        self.candidates_per_depth[depth] += num_candidates
+        self.children_per_depth[depth] += num_children
+        self.forced_per_depth[depth] += num_forced
+        self.seconds_per_depth[depth] += seconds
+
+    def _extend(self, num_depths: int) -> None:
+        while len(self.nodes_per_depth) < num_depths:
+            self.nodes_per_depth.append(0)
+            self.candidates_per_depth.append(0)
+            self.children_per_depth.append(0)
+            self.forced_per_depth.append(0)
+            self.seconds_per_depth.append(0.0)
+
+    def record_terminal_node(self) -> None:
+        self.terminal_nodes += 1
+
+    @property
+    def nodes_expanded(self) -> int:
+        return sum(self.nodes_per_depth)
+
+    @property
+    def forced_placements(self) -> int:
+        return sum(self.forced_per_depth)
+
+    @property
+    def dead_ends(self) -> int:
+        return sum(self.candidates_per_depth) - sum(self.children_per_depth)
+
+    @property
+    def seconds(self) -> float:
+        return sum(self.seconds_per_depth)
+
+    @property
+    def branching_factors(self) -> list[float]:
+        return [
+            num_children / num_nodes if num_nodes else 0.0 for num_nodes,
+            num_children in zip(self.nodes_per_depth, self.children_per_depth)
+        ]
+
+    def merge(self, other: 'SearchStatistics') -> None:
+        self._extend(len(other.nodes_per_depth))
+        for depth in range(len(other.nodes_per_depth)):
+            self.nodes_per_depth[depth] += other.nodes_per_depth[depth]
+            self.candidates_per_depth[depth] += other.candidates_per_depth[
+                depth]
+            self.children_per_depth[depth] += other.children_per_depth[depth]
+            self.forced_per_depth[depth] += other.forced_per_depth[depth]
+            self.seconds_per_depth[depth] += other.seconds_per_depth[depth]
+        self.terminal_nodes += other.terminal_nodes
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'nodes_expanded': self.nodes_expanded,
+            'terminal_nodes': self.terminal_nodes,
+            'forced_placements': self.forced_placements,
+            'dead_ends': self.dead_ends,
+            'seconds': self.seconds,
+            'nodes_per_depth': list(self.nodes_per_depth),
+            'branching_factors': self.branching_factors,
+            'seconds_per_depth': list(self.seconds_per_depth),
+        }
+
+    def __repr__(self) -> str:
+        return (f'SearchStatistics(nodes_expanded={self.nodes_expanded}, '
+                f'terminal_nodes={self.terminal_nodes}, '
+                f'forced_placements={self.forced_placements}, '
+                f'dead_ends={self.dead_ends}, seconds={self.seconds:.3f})')
@@ -0,0 +1,60 @@
+import unittest
+
+from search_statistics import SearchStatistics
+
+
+class SearchStatisticsTest(unittest.TestCase):
+
+    def test_record_expansion(self):
+        statistics = SearchStatistics()
+        statistics.record_expansion(0, 3, 2, 5, 0.5)
+        statistics.record_expansion(1, 2, 2, 1, 0.25)
+        statistics.record_expansion(1, 2, 0, 0, 0.25)
+        self.assertListEqual(statistics.nodes_per_depth, [1, 2])
+        self.assertListEqual(statistics.candidates_per_depth, [3, 4])
+        self.assertListEqual(statistics.children_per_depth, [2, 2])
+        self.assertListEqual(statistics.seconds_per_depth, [0.5, 0.5])
+        self.assertListEqual(statistics.branching_factors, [2.0, 1.0])
+        self.assertEqual(statistics.nodes_expanded, 3)
+        self.assertEqual(statistics.forced_placements, 6)
+        self.assertEqual(statistics.dead_ends, 3)
+        self.assertEqual(statistics.seconds, 1.0)
+
+    def test_record_terminal_node(self):
+        statistics = SearchStatistics()
+        statistics.record_terminal_node()
+        statistics.record_terminal_node()
+        self.assertEqual(statistics.terminal_nodes, 2)
+
+    def test_merge(self):
+        statistics = SearchStatistics()
+        statistics.record_expansion(0, 3, 2, 5, 0.5)
+        other = SearchStatistics()
+        other.record_expansion(0, 1, 1, 0, 0.5)
+        other.record_expansion(1, 2, 1, 1, 0.5)
+        other.record_terminal_node()
+        statistics.merge(other)
+        self.assertListEqual(statistics.nodes_per_depth, [2, 1])
+        self.assertListEqual(statistics.candidates_per_depth, [4, 2])
+        self.assertListEqual(statistics.children_per_depth, [3, 1])
+        self.assertListEqual(statistics.forced_per_depth, [5, 1])
+        self.assertEqual(statistics.terminal_nodes, 1)
+
+    def test_as_dict(self):
+        statistics = SearchStatistics()
+        statistics.record_expansion(0, 2, 1, 0, 0.5)
+        self.assertDictEqual(
+            statistics.as_dict(), {
+                'nodes_expanded': 1,
+                'terminal_nodes': 0,
+                'forced_placements': 0,
+                'dead_ends': 1,
+                'seconds': 0.5,
+                'nodes_per_depth': [1],
+                'branching_factors': [1.0],
+                'seconds_per_depth': [0.5],
+            })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+from collections import namedtuple
+from time import perf_counter
+from typing import List, Optional
+
+from latin_square_search_node import LatinSquareSearchNode
+
+TreeSizeEstimate = namedtuple('TreeSizeEstimate',
+                              ['nodes', 'terminal_nodes', 'seconds'])
+
+
+def estimate_tree_size(search_node: LatinSquareSearchNode,
+                       num_probes: int = 1000,
+                       seed: Optional[int] = None) -> TreeSizeEstimate:
+    return estimate_forest_size([search_node], num_probes, seed)
+
+
+def estimate_forest_size(search_nodes: List[LatinSquareSearchNode],
+                         num_probes: int = 1000,
+                         seed: Optional[int] = None) -> TreeSizeEstimate:
+    if num_probes <= 0:
+        raise ValueError
+    if not search_nodes:
+        return TreeSizeEstimate(nodes=0.0, terminal_nodes=0.0, seconds=0.0)
+    rng = random.Random(seed)
+    total_nodes = 0.0
+    total_terminal_nodes = 0.0
+    total_seconds = 0.0
+    for _ in range(num_probes):
+        search_node = rng.choice(search_nodes).copy()
+        nodes, terminal_nodes, seconds = _probe(search_node, rng)
+        total_nodes += nodes
+        total_terminal_nodes += terminal_nodes
+        total_seconds += seconds
+    scale = len(search_nodes) / num_probes
+    return TreeSizeEstimate(nodes=total_nodes * scale,
+                            terminal_nodes=total_terminal_nodes * scale,
+                            seconds=total_seconds * scale)
+
+
+def _probe(search_node: LatinSquareSearchNode,
+           rng: random.Random) -> TreeSizeEstimate:
+    nodes = 1.0
+    seconds = 0.0
+    level_size = 1.0
+    while not search_node.is_terminal():
+        num_children = 0
+        chosen_node = None
+        copy_seconds = 0.0
+        start = perf_counter()
+        for child_node in search_node.get_children():
+            num_children += 1
+            if rng.randrange(num_children) == 0:
+                if search_node._in_place:
+                    copy_start = perf_counter()
+                    child_node = child_node.copy()
+                    copy_seconds += perf_counter() - copy_start
+                chosen_node = child_node
+        seconds += level_size * (perf_counter() - start - copy_seconds)
+        if chosen_node is None:
+            return TreeSizeEstimate(nodes=nodes,
+                                    terminal_nodes=0.0,
+                                    seconds=seconds)
+        level_size *= num_children
+        nodes += level_size
+        search_node = chosen_node
+    return TreeSizeEstimate(nodes=nodes,
+                            terminal_nodes=level_size,
+                            seconds=seconds)
@@ -0,0 +1,58 @@
+import unittest
+from copy import deepcopy
+
+from bitmask_latin_square_search_node import BitmaskLatinSquareSearchNode
+from latin_square_search_node import LatinSquareSearchNode
+from tree_size_estimator import estimate_forest_size, estimate_tree_size
+
+
+class TreeSizeEstimatorTest(unittest.TestCase):
+
+    def test_terminal_root(self):
+        estimate = estimate_tree_size(LatinSquareSearchNode(3), num_probes=10)
+        self.assertEqual(estimate.nodes, 1)
+        self.assertEqual(estimate.terminal_nodes, 1)
+
+    def test_estimate_tree_size(self):
+        for search_node in [
+                LatinSquareSearchNode(5),
+                LatinSquareSearchNode(5, in_place=True),
+                BitmaskLatinSquareSearchNode(5, in_place=True)
+        ]:
+            estimate = estimate_tree_size(search_node, num_probes=1000, seed=0)
+            self.assertAlmostEqual(estimate.terminal_nodes, 56, delta=10)
+            self.assertGreater(estimate.nodes, estimate.terminal_nodes)
+            self.assertGreater(estimate.seconds, 0)
+
+    def test_search_node_unchanged(self):
+        for search_node in [
+                LatinSquareSearchNode(5, in_place=True),
+                BitmaskLatinSquareSearchNode(5, in_place=True)
+        ]:
+            symbols = deepcopy(search_node.symbols)
+            liberties = deepcopy(search_node._liberties)
+            estimate_tree_size(search_node, num_probes=10, seed=0)
+            self.assertListEqual(search_node.symbols, symbols)
+            self.assertListEqual(search_node._liberties, liberties)
+            self.assertListEqual(search_node._trail, [])
+
+    def test_seed(self):
+        search_node = LatinSquareSearchNode(5)
+        self.assertEqual(
+            estimate_tree_size(search_node, num_probes=10, seed=1).nodes,
+            estimate_tree_size(search_node, num_probes=10, seed=1).nodes)
+
+    def test_estimate_forest_size(self):
+        estimate = estimate_forest_size([], num_probes=10)
+        self.assertEqual(estimate.nodes, 0)
+        search_nodes = [LatinSquareSearchNode(3), LatinSquareSearchNode(3)]
+        estimate = estimate_forest_size(search_nodes, num_probes=10)
+        self.assertEqual(estimate.terminal_nodes, 2)
+
+    def test_num_probes(self):
+        self.assertRaises(ValueError, estimate_tree_size,
+                          LatinSquareSearchNode(4), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
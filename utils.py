@@ -28,7 +28,12 @@ _hash_power = lambda r, c, n: (n ** 2 - 1) - (r * n + c)
 _hash_triple = lambda triple, n: (triple.s) * n ** _hash_power(triple.r, triple.c, n)
 
 def hash_latin_square(latin_square):
-    return hash_orthognoal_array(to_orthogonal_array(latin_square))
+    n = len(latin_square)
+    hash_val = 0
+    for row in latin_square:
+        for s in row:
+            hash_val = hash_val * n + s
+    return hash_val
 
 def hash_orthognoal_array(orthogonal_array):
     n = _get_n(orthogonal_array)
@@ -41,3 +46,78 @@ def from_hash_val(hash_val, n):
             latin_square[r][c] = hash_val % n
             hash_val //= n
     return latin_square
+
+
+def _get_hash_size(n):
+    return max(1, ((n ** (n * n) - 1).bit_length() + 7) // 8)
+
+def _get_hash_group_size(n):
+    if n == 1:
+        return 1
+    group_size = 1
+    while n ** (group_size + 1) < 1 << 63:
+        group_size += 1
+    return group_size
+
+def _get_hash_groups(n):
+    num_digits = n * n
+    group_size = _get_hash_group_size(n)
+    first_group_size = num_digits % group_size or group_size
+    starts = [0] + list(range(first_group_size, num_digits, group_size))
+    return list(zip(starts, starts[1:] + [num_digits]))
+
+def hash_latin_squares(latin_squares):
+    import numpy as np
+    latin_squares = np.asarray(latin_squares, dtype=np.uint64)
+    if len(latin_squares) == 0:
+        return []
+    k, n = latin_squares.shape[0], latin_squares.shape[1]
+    digits = latin_squares.reshape(k, n * n)
+    groups = _get_hash_groups(n)
+    group_vals = np.zeros((k, len(groups)), dtype=np.uint64)
+    for j, (start, end) in enumerate(groups):
+        acc = np.zeros(k, dtype=np.uint64)
+        for i in range(start, end):
+            acc = acc * np.uint64(n) + digits[:, i]
+        group_vals[:, j] = acc
+    multipliers = [n ** (end - start) for start, end in groups]
+    hash_vals = []
+    for row in group_vals.tolist():
+        hash_val = 0
+        for multiplier, group_val in zip(multipliers, row):
+            hash_val = hash_val * multiplier + group_val
+        hash_vals.append(hash_val)
+    return hash_vals
+
+def hash_latin_squares_to_bytes(latin_squares):
+    hash_vals = hash_latin_squares(latin_squares)
+    if not hash_vals:
+        return b''
+    hash_size = _get_hash_size(len(latin_squares[0]))
+    return b''.join(hash_val.to_bytes(hash_size, 'big') for hash_val in hash_vals)
+
+def from_hash_vals(hash_vals, n):
+    import numpy as np
+    groups = _get_hash_groups(n)
+    divisors = [n ** (end - start) for start, end in reversed(groups)]
+    group_vals = []
+    for hash_val in hash_vals:
+        row = []
+        for divisor in divisors:
+            hash_val, group_val = divmod(hash_val, divisor)
+            row.append(group_val)
+        group_vals.append(row[::-1])
+    group_vals = np.array(group_vals, dtype=np.uint64).reshape(-1, len(groups))
+    digits = np.zeros((len(group_vals), n * n), dtype=np.uint8)
+    for j, (start, end) in enumerate(groups):
+        acc = group_vals[:, j].copy()
+        for i in reversed(range(start, end)):
+            digits[:, i] = acc % np.uint64(n)
+            acc //= np.uint64(n)
+    return digits.reshape(-1, n, n)
+
+def from_hash_bytes(buffer, n):
+    hash_size = _get_hash_size(n)
+    hash_vals = [int.from_bytes(buffer[i:i + hash_size], 'big')
+                 for i in range(0, len(buffer), hash_size)]
+    return from_hash_vals(hash_vals, n)
@@ -3,6 +3,11 @@ import unittest
 import utils
 from utils import Triple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class OperationsTest(unittest.TestCase):
 
@@ -84,6 +89,53 @@ class OperationsTest(unittest.TestCase):
         ]
         self.assertListEqual(actual, expected)
 
+    def test_hash_latin_square_matches_orthogonal_array(self):
+        latin_square = [
+            [1, 3, 0, 2],
+            [3, 1, 2, 0],
+            [0, 2, 3, 1],
+            [2, 0, 1, 3],
+        ]
+        self.assertEqual(
+            utils.hash_latin_square(latin_square),
+            utils.hash_orthognoal_array(utils.to_orthogonal_array(latin_square)))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_hash_latin_squares(self):
+        latin_squares = [
+            [[(r + c + k) % n for c in range(n)] for r in range(n)]
+            for n in (1, 3, 8) for k in range(3)
+        ]
+        for n in (1, 3, 8):
+            batch = [ls for ls in latin_squares if len(ls) == n]
+            expected = [utils.hash_latin_square(ls) for ls in batch]
+            self.assertListEqual(
+                utils.hash_latin_squares(np.array(batch, dtype=np.uint8)),
+                expected)
+            self.assertListEqual(
+                utils.from_hash_vals(expected, n).tolist(), batch)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_hash_latin_squares_to_bytes(self):
+        latin_squares = np.array([
+            [[0, 1, 2], [1, 2, 0], [2, 0, 1]],
+            [[0, 2, 1], [2, 1, 0], [1, 0, 2]],
+        ], dtype=np.uint8)
+        buffer = utils.hash_latin_squares_to_bytes(latin_squares)
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(int.from_bytes(buffer[:2], 'big'), 4069)
+        self.assertListEqual(
+            utils.from_hash_bytes(buffer, 3).tolist(), latin_squares.tolist())
+        self.assertEqual(utils.from_hash_bytes(b'', 3).shape, (0, 3, 3))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_hash_empty_batch(self):
+        self.assertListEqual(utils.hash_latin_squares([]), [])
+        self.assertListEqual(
+            utils.hash_latin_squares(np.zeros((0, 3, 3), dtype=np.uint8)), [])
+        self.assertEqual(utils.hash_latin_squares_to_bytes([]), b'')
+        self.assertEqual(utils.from_hash_vals([], 3).shape, (0, 3, 3))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file